@@ -0,0 +1,38 @@
+"""add fulltext index on personas
+
+Revision ID: 5e7c1a9d4b63
+Revises: d3e8a5f0b217
+Create Date: 2025-09-16 11:08:52.771304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e7c1a9d4b63'
+down_revision: Union[str, None] = 'd3e8a5f0b217'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 全文索引仅 MySQL 支持，其他数据库继续使用 LIKE 搜索
+    if op.get_context().dialect.name != 'mysql':
+        return
+    op.create_index(
+        'ix_personas_fulltext',
+        'personas',
+        ['name', 'description', 'content'],
+        unique=False,
+        mysql_prefix='FULLTEXT',
+        mysql_with_parser='ngram'
+    )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'mysql':
+        return
+    op.drop_index('ix_personas_fulltext', table_name='personas')
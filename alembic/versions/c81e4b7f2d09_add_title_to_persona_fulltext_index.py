@@ -0,0 +1,47 @@
+"""add title to persona fulltext index
+
+Revision ID: c81e4b7f2d09
+Revises: a6f2d8c3e915
+Create Date: 2025-09-21 14:33:06.518270
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81e4b7f2d09'
+down_revision: Union[str, None] = 'a6f2d8c3e915'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 全文索引仅 MySQL 支持，其他数据库继续使用 LIKE 搜索
+    if op.get_context().dialect.name != 'mysql':
+        return
+    op.drop_index('ix_personas_fulltext', table_name='personas')
+    op.create_index(
+        'ix_personas_fulltext',
+        'personas',
+        ['name', 'title', 'description', 'content'],
+        unique=False,
+        mysql_prefix='FULLTEXT',
+        mysql_with_parser='ngram'
+    )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'mysql':
+        return
+    op.drop_index('ix_personas_fulltext', table_name='personas')
+    op.create_index(
+        'ix_personas_fulltext',
+        'personas',
+        ['name', 'description', 'content'],
+        unique=False,
+        mysql_prefix='FULLTEXT',
+        mysql_with_parser='ngram'
+    )
@@ -3,22 +3,85 @@
 主要功能：定义API依赖项，例如数据库会话和当前用户获取
 """
 
+import hashlib
+import threading
+import time
 from typing import Generator, Optional
 
+from cachetools import TTLCache, cached
 from fastapi import Depends, HTTPException, status, Header
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
+import jwt
+from jwt import ExpiredSignatureError, PyJWTError
 from sqlalchemy.orm import Session
 
 from app.db.session import SessionLocal
 from app.core.config import settings
 from app.crud.user import user as crud_user
-from app.schemas.user import User
+from app.schemas.user import UserOut
 
 
+# JWT 密钥（预先编码为字节）与算法在导入时固定，校验令牌时不再逐次读取配置
+_SECRET_KEY = settings.SECRET_KEY.encode()
+_ALGORITHMS = [settings.ALGORITHM]
+# 解码时一并要求 exp 与 sub 声明存在，缺失即视为无效令牌
+_DECODE_OPTIONS = {"require": ["exp", "sub"]}
+
 # OAuth2 方案，用于从请求头中提取令牌
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
 
+# 已验证令牌的载荷缓存，键为令牌摘要，避免在内存中保存原始令牌
+_token_cache: TTLCache = TTLCache(maxsize=4096, ttl=60)
+_token_cache_lock = threading.Lock()
+
+
+def _token_cache_key(token: str) -> bytes:
+    """计算令牌的缓存键
+
+    Args:
+        token (str): 原始令牌。
+
+    Returns:
+        bytes: 令牌的 BLAKE2b 摘要。
+    """
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+@cached(_token_cache, key=_token_cache_key, lock=_token_cache_lock)
+def _verify_token(token: str) -> dict:
+    """校验令牌签名并解码载荷，仅缓存校验成功的结果
+
+    Args:
+        token (str): 认证令牌。
+
+    Raises:
+        PyJWTError: 令牌无效、已过期或缺少必需声明。
+
+    Returns:
+        dict: 令牌载荷。
+    """
+    return jwt.decode(token, _SECRET_KEY, algorithms=_ALGORITHMS, options=_DECODE_OPTIONS)
+
+
+def decode_token(token: str) -> dict:
+    """解码认证令牌，命中缓存时重新检查过期时间
+
+    Args:
+        token (str): 认证令牌。
+
+    Raises:
+        PyJWTError: 令牌无效或已过期。
+
+    Returns:
+        dict: 令牌载荷。
+    """
+    payload = _verify_token(token)
+    if payload["exp"] <= time.time():
+        with _token_cache_lock:
+            _token_cache.pop(_token_cache_key(token), None)
+        raise ExpiredSignatureError("Signature has expired.")
+    return payload
+
 
 def get_db() -> Generator:
     """获取数据库会话
@@ -33,10 +96,69 @@ def get_db() -> Generator:
         db.close()
 
 
+# 认证失败时异常的状态码、详情与响应头，均为模块级常量，构造异常时无需重新创建
+_CREDENTIALS_STATUS = status.HTTP_401_UNAUTHORIZED
+_CREDENTIALS_DETAIL = "Could not validate credentials"
+_CREDENTIALS_HEADERS = {"WWW-Authenticate": "Bearer"}
+
+
+def _credentials_exception() -> HTTPException:
+    """构造认证失败异常
+
+    每次返回新的实例：共享同一个异常对象会让并发请求互相覆盖其堆栈与 __context__。
+
+    Returns:
+        HTTPException: 401 认证失败异常。
+    """
+    return HTTPException(
+        status_code=_CREDENTIALS_STATUS,
+        detail=_CREDENTIALS_DETAIL,
+        headers=_CREDENTIALS_HEADERS,
+    )
+
+
+# 当前用户缓存，键为用户邮箱，值为与数据库会话解绑的不可变 UserOut 对象
+_user_cache: TTLCache = TTLCache(maxsize=4096, ttl=30)
+_user_cache_lock = threading.Lock()
+
+
+def _get_user_by_email(db: Session, email: str) -> Optional[UserOut]:
+    """根据邮箱获取用户，优先读取缓存
+
+    Args:
+        db (Session): 数据库会话。
+        email (str): 用户邮箱。
+
+    Returns:
+        Optional[UserOut]: 用户对象或None。
+    """
+    with _user_cache_lock:
+        user = _user_cache.get(email)
+    if user is not None:
+        return user
+    db_user = crud_user.get_by_email(db, email=email)
+    if db_user is None:
+        return None
+    user = UserOut.from_db(db_user)
+    with _user_cache_lock:
+        _user_cache[email] = user
+    return user
+
+
+def evict_cached_user(email: str) -> None:
+    """将用户从缓存中移除，用户信息变更后调用
+
+    Args:
+        email (str): 用户邮箱。
+    """
+    with _user_cache_lock:
+        _user_cache.pop(email, None)
+
+
 async def get_current_user(
     db: Session = Depends(get_db),
     token: str = Depends(oauth2_scheme)
-) -> User:
+) -> UserOut:
     """获取当前认证用户
 
     Args:
@@ -47,30 +169,22 @@ async def get_current_user(
         HTTPException: 凭证无效或用户不存在。
 
     Returns:
-        User: 当前用户对象。
+        UserOut: 当前用户对象。
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_email: str = payload.get("sub")
-        if user_email is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-    user = crud_user.get_by_email(db, email=user_email)
+        payload = decode_token(token)
+    except PyJWTError:
+        raise _credentials_exception() from None
+    user = _get_user_by_email(db, email=payload["sub"])
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
     return user
 
 
 async def get_current_user_optional(
     db: Session = Depends(get_db),
     authorization: str = Header(None)
-) -> Optional[User]:
+) -> Optional[UserOut]:
     """获取可选的当前认证用户，允许匿名访问
 
     Args:
@@ -78,37 +192,33 @@ async def get_current_user_optional(
         authorization (str): 认证头，可选。
 
     Returns:
-        Optional[User]: 当前用户对象或None（匿名访问）。
+        Optional[UserOut]: 当前用户对象或None（匿名访问）。
     """
     if not authorization or not authorization.startswith("Bearer "):
         return None
     
     token = authorization.split(" ")[1]
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_email: str = payload.get("sub")
-        if user_email is None:
-            return None
-    except JWTError:
+        payload = decode_token(token)
+    except PyJWTError:
         return None
     
-    user = crud_user.get_by_email(db, email=user_email)
-    return user
+    return _get_user_by_email(db, email=payload["sub"])
 
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: UserOut = Depends(get_current_user)
+) -> UserOut:
     """获取当前活跃用户
 
     Args:
-        current_user (User): 当前认证用户。
+        current_user (UserOut): 当前认证用户。
 
     Raises:
         HTTPException: 用户不活跃。
 
     Returns:
-        User: 当前活跃用户对象。
+        UserOut: 当前活跃用户对象。
     """
     # 这里可以添加用户活跃状态的检查，例如用户是否被禁用
     # if not crud_user.is_active(current_user):
@@ -4,70 +4,89 @@
 """
 
 from datetime import timedelta
-from typing import Any
 
-from fastapi.responses import RedirectResponse
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
+from fastapi.responses import ORJSONResponse, RedirectResponse
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
-from requests_oauthlib import OAuth2Session
 import os
-import jose.jwt as jwt
-from jose import JWTError
+import secrets
+from urllib.parse import urlencode
+import httpx
 
+from app.api.deps import evict_cached_user, get_current_user
 from app.core.config import settings
-from app.core.security import create_access_token, verify_password
+from app.core.limiter import limiter
+from app.core.security import (
+    create_access_token,
+    pepper_enabled,
+    run_password_task,
+    verify_and_update_password,
+    verify_dummy_password,
+)
+from app.crud.persona import persona as crud_persona
 from app.crud.user import user as crud_user
 from app.db.session import get_db
-from app.schemas.user import UserCreate, User, Token, UserUpdate
-from pydantic import BaseModel
+from app.schemas.user import UserCreate, User, UserOut, Token, UserUpdate
 
+router = APIRouter()
 
-class TokenData(BaseModel):
-    username: str = None
+GITHUB_AUTHORIZE_URL = "https://github.com/login/oauth/authorize"
+GITHUB_TOKEN_URL = "https://github.com/login/oauth/access_token"
+GITHUB_USER_URL = "https://api.github.com/user"
+GITHUB_EMAILS_URL = "https://api.github.com/user/emails"
+
+# 复用的GitHub异步HTTP客户端（连接池与keep-alive，启用HTTP/2多路复用），在应用关闭时释放
+github_client = httpx.AsyncClient(
+    http2=True,
+    timeout=10.0,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+)
 
-router = APIRouter()
 
+def _token_response(email: str) -> ORJSONResponse:
+    """为用户签发访问令牌，并直接编码为 JSON 响应
 
-# 依赖项：获取当前用户
-async def get_current_user(db: Session = Depends(get_db), token: str = Depends(OAuth2PasswordBearer(tokenUrl="token"))):
-    """获取当前认证用户
+    令牌响应结构固定，直接返回响应对象可跳过 Token 模式的校验与序列化。
 
     Args:
-        db (Session): 数据库会话。
-        token (str): 认证令牌。
+        email (str): 用户邮箱，作为令牌主题。
+
+    Returns:
+        ORJSONResponse: 包含访问令牌的响应。
+    """
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    return ORJSONResponse({
+        "access_token": create_access_token(email, expires_delta=access_token_expires),
+        "token_type": "bearer",
+    })
+
+
+# 用户信息响应直接返回 UserOut，不再经过 response_model 校验；文档中的响应结构仍为 User
+_USER_RESPONSES = {200: {"model": User}}
 
-    Raises:
-        HTTPException: 凭证无效或用户不存在。
+
+def _user_response(user: UserOut) -> ORJSONResponse:
+    """将用户信息直接编码为 JSON 响应
+
+    orjson 原生支持 dataclass 与 datetime，跳过 FastAPI 的 jsonable_encoder 逐字段转换。
+
+    Args:
+        user (UserOut): 用户信息。
 
     Returns:
-        User: 当前用户对象。
+        ORJSONResponse: 用户信息响应。
     """
-    print("Token received:", token)  # 调试输出
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-    user = crud_user.get_by_email(db, email=username)
-    if user is None:
-        raise credentials_exception
-    return user
+    return ORJSONResponse(user)
 
 
-@router.post("/register", response_model=User)
+@router.post("/register", response_model=None, responses=_USER_RESPONSES)
 def register_user(
     *,
     db: Session = Depends(get_db),
     user_in: UserCreate
-) -> Any:
+) -> ORJSONResponse:
     """注册新用户
 
     Args:
@@ -78,26 +97,29 @@ def register_user(
         HTTPException: 邮箱已注册。
 
     Returns:
-        Any: 新创建的用户对象。
+        ORJSONResponse: 新创建的用户信息。
     """
-    user = crud_user.get_by_email(db, email=user_in.email)
-    if user:
+    if crud_user.exists_by_email(db, email=user_in.email):
         raise HTTPException(status_code=400, detail="Email already registered")
-    user = crud_user.get_by_username(db, username=user_in.username)
-    if user:
+    if crud_user.exists_by_username(db, username=user_in.username):
         raise HTTPException(status_code=400, detail="Username already registered")
     user = crud_user.create(db, obj_in=user_in)
-    return user
+    return _user_response(UserOut.from_db(user))
 
 
 @router.post("/login", response_model=Token)
-def login_access_token(
+@limiter.limit(settings.LOGIN_RATE_LIMIT)
+async def login_access_token(
+    request: Request,
     db: Session = Depends(get_db),
     form_data: OAuth2PasswordRequestForm = Depends()
-) -> Any:
+) -> ORJSONResponse:
     """用户登录并获取访问令牌
 
+    密码校验开销较大，接口按客户端IP限流；数据库查询与密码校验分别在线程池中执行，不阻塞事件循环。
+
     Args:
+        request (Request): 请求对象，供限流器识别客户端。
         db (Session): 数据库会话。
         form_data (OAuth2PasswordRequestForm): OAuth2密码请求表单。
 
@@ -105,32 +127,53 @@ def login_access_token(
         HTTPException: 邮箱或密码不正确。
 
     Returns:
-        Any: 访问令牌。
+        ORJSONResponse: 访问令牌响应。
     """
-    user = crud_user.get_by_email(db, email=form_data.username)
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    user = await run_in_threadpool(crud_user.get_by_email, db, email=form_data.username)
+    if not user:
+        # 用户不存在时同样执行一次哈希校验，避免通过响应耗时枚举邮箱
+        await run_password_task(verify_dummy_password, form_data.password)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Incorrect email or password")
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    return {"access_token": create_access_token(user.email, expires_delta=access_token_expires), "token_type": "bearer"}
+    verified, new_hash = await run_password_task(
+        verify_and_update_password, form_data.password, user.hashed_password, user.password_peppered
+    )
+    if not verified:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Incorrect email or password")
+    if new_hash:
+        # 旧算法（如 bcrypt）或不含 pepper 的哈希在登录成功后升级为含 pepper 的 Argon2id
+        user = await run_in_threadpool(
+            crud_user.update,
+            db,
+            db_obj=user,
+            obj_in={"hashed_password": new_hash, "password_peppered": pepper_enabled()}
+        )
+    return _token_response(user.email)
 
 
 @router.get("/github/login")
 def github_login():
     """重定向到GitHub OAuth授权页面
     """
-    github = OAuth2Session(settings.GITHUB_CLIENT_ID, redirect_uri=settings.GITHUB_REDIRECT_URI)
-    authorization_url, state = github.authorization_url("https://github.com/login/oauth/authorize")
-    print(authorization_url)
+    # 授权地址只是拼接查询参数，无需为每次请求创建 OAuth2Session
+    params = {
+        "response_type": "code",
+        "client_id": settings.GITHUB_CLIENT_ID,
+        "redirect_uri": settings.GITHUB_REDIRECT_URI,
+        "state": secrets.token_urlsafe(30),
+    }
+    authorization_url = f"{GITHUB_AUTHORIZE_URL}?{urlencode(params)}"
     return RedirectResponse(url=authorization_url)
 
 
 @router.get("/github/callback", response_model=Token)
-def github_callback(
+async def github_callback(
     code: str,
     db: Session = Depends(get_db)
-) -> Any:
+) -> ORJSONResponse:
     """GitHub OAuth回调，处理授权码并完成登录/注册
 
+    对GitHub的请求均为异步请求，不会阻塞事件循环；数据库操作在线程池中执行。
+
     Args:
         code (str): GitHub授权码。
         db (Session): 数据库会话。
@@ -139,19 +182,32 @@ def github_callback(
         HTTPException: 无法获取GitHub访问令牌或用户信息。
 
     Returns:
-        Any: 访问令牌。
+        ORJSONResponse: 访问令牌响应。
     """
-    github = OAuth2Session(settings.GITHUB_CLIENT_ID, redirect_uri=settings.GITHUB_REDIRECT_URI)
     try:
-        token = github.fetch_token(
-            "https://github.com/login/oauth/access_token",
-            client_secret=settings.GITHUB_CLIENT_SECRET,
-            code=code
+        token_response = await github_client.post(
+            GITHUB_TOKEN_URL,
+            data={
+                "client_id": settings.GITHUB_CLIENT_ID,
+                "client_secret": settings.GITHUB_CLIENT_SECRET,
+                "code": code,
+                "redirect_uri": settings.GITHUB_REDIRECT_URI,
+            },
+            headers={"Accept": "application/json"},
         )
-    except Exception as e:
+        token_data = token_response.json()
+    except (httpx.HTTPError, ValueError) as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Could not get GitHub access token: {e}")
+    access_token = token_data.get("access_token")
+    if not access_token:
+        error = token_data.get("error_description") or token_data.get("error") or token_response.status_code
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Could not get GitHub access token: {error}")
 
-    github_user_response = github.get("https://api.github.com/user")
+    api_headers = {"Authorization": f"Bearer {access_token}", "Accept": "application/vnd.github+json"}
+    try:
+        github_user_response = await github_client.get(GITHUB_USER_URL, headers=api_headers)
+    except httpx.HTTPError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Could not get GitHub user info")
     if github_user_response.status_code != 200:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Could not get GitHub user info")
 
@@ -160,8 +216,11 @@ def github_callback(
     github_username = github_user_data["login"]
     email = github_user_data.get("email")
     if not email:
-        emails_resp = github.get("https://api.github.com/user/emails")
-        if emails_resp.status_code == 200:
+        try:
+            emails_resp = await github_client.get(GITHUB_EMAILS_URL, headers=api_headers)
+        except httpx.HTTPError:
+            emails_resp = None
+        if emails_resp is not None and emails_resp.status_code == 200:
             emails = emails_resp.json()
             email = next(
                 (e["email"] for e in emails if e["primary"] and e["verified"]),
@@ -170,6 +229,29 @@ def github_callback(
         if not email:
             email = f"{github_username}@github.com"  # 兜底占位符
 
+    user = await run_in_threadpool(
+        _get_or_create_github_user,
+        db,
+        github_id=github_id,
+        github_username=github_username,
+        email=email
+    )
+
+    return _token_response(user.email)
+
+
+def _get_or_create_github_user(db: Session, *, github_id: str, github_username: str, email: str):
+    """根据GitHub用户信息查找或创建本地用户
+
+    Args:
+        db (Session): 数据库会话。
+        github_id (str): GitHub 用户ID。
+        github_username (str): GitHub 用户名。
+        email (str): 用户邮箱。
+
+    Returns:
+        User: 本地用户对象。
+    """
     user = crud_user.get_by_github_id_or_username(db, github_id=github_id, username=github_username)
     if not user:
         # 如果用户不存在，则创建新用户
@@ -185,57 +267,61 @@ def github_callback(
         # 如果用户存在，更新其信息（例如邮箱可能在GitHub上更新了）
         user_update_data = {"github_username": github_username}
         user = crud_user.update(db, db_obj=user, obj_in=user_update_data)
-
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    return {"access_token": create_access_token(user.email, expires_delta=access_token_expires), "token_type": "bearer"}
+        evict_cached_user(user.email)
+    return user
 
 
-@router.get("/me", response_model=User)
+@router.get("/me", response_model=None, responses=_USER_RESPONSES)
 def read_users_me(
-    current_user: User = Depends(get_current_user)
-) -> Any:
+    current_user: UserOut = Depends(get_current_user)
+) -> ORJSONResponse:
     """获取当前用户信息
 
     Args:
-        current_user (User): 当前认证用户。
+        current_user (UserOut): 当前认证用户。
 
     Returns:
-        Any: 当前用户对象。
+        ORJSONResponse: 当前用户信息。
     """
-    return current_user
+    return _user_response(current_user)
 
-@router.put("/profile", response_model=User)
+@router.put("/profile", response_model=None, responses=_USER_RESPONSES)
 def update_user_profile(
     *,
     db: Session = Depends(get_db),
     user_update: UserUpdate,
-    current_user: User = Depends(get_current_user)
-) -> Any:
+    current_user: UserOut = Depends(get_current_user)
+) -> ORJSONResponse:
     """更新当前用户个人信息
 
     Args:
         db (Session): 数据库会话。
         user_update (UserUpdate): 用户更新数据。
-        current_user (User): 当前认证用户。
+        current_user (UserOut): 当前认证用户。
 
     Raises:
         HTTPException: 邮箱或用户名已存在。
 
     Returns:
-        Any: 更新后的用户对象。
+        ORJSONResponse: 更新后的用户信息。
     """
-    # 检查邮箱是否已被其他用户使用
+    # 检查邮箱是否已被其他用户使用；排除自身，MySQL 排序规则不区分大小写，仅修改大小写时会匹配到自己
     if user_update.email and user_update.email != current_user.email:
-        existing_user = crud_user.get_by_email(db, email=user_update.email)
-        if existing_user and existing_user.id != current_user.id:
+        if crud_user.exists_by_email(db, email=user_update.email, exclude_id=current_user.id):
             raise HTTPException(status_code=400, detail="Email already registered")
     
     # 检查用户名是否已被其他用户使用
     if user_update.username and user_update.username != current_user.username:
-        existing_user = crud_user.get_by_username(db, username=user_update.username)
-        if existing_user and existing_user.id != current_user.id:
+        if crud_user.exists_by_username(db, username=user_update.username, exclude_id=current_user.id):
             raise HTTPException(status_code=400, detail="Username already registered")
     
-    # 更新用户信息
-    user = crud_user.update(db, db_obj=current_user, obj_in=user_update)
-    return user
\ No newline at end of file
+    # 只写入请求中提供的字段，直接按ID执行 UPDATE，无需先加载数据库对象；并使旧邮箱对应的缓存失效
+    user = crud_user.update_by_id(db, id=current_user.id, uuid=current_user.uuid, obj_in=user_update)
+    evict_cached_user(current_user.email)
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    # 作者列表与作者统计的缓存中包含昵称，昵称变更后需要失效
+    if user_update.nickname is not None and user_update.nickname != current_user.nickname:
+        crud_persona.invalidate_cache()
+    return _user_response(UserOut.from_db(user))
\ No newline at end of file
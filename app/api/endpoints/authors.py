@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.crud.persona import persona as crud_persona
 from app.crud.user import user as crud_user
+from app.schemas.user import UserPublic
 
 # 创建路由
 router = APIRouter()
@@ -46,33 +47,7 @@ def get_author_stats(
     Returns:
         Dict[str, Dict[str, str]]: 作者统计信息，包含每个作者的人设数量和昵称
     """
-    from sqlalchemy import func
-    from app.db.models.persona import Persona
-    from app.db.models.user import User
-    
-    # 获取每个作者的人设数量
-    stats = db.query(
-        Persona.author_uuid,
-        User.nickname,
-        func.count(Persona.id).label('count')
-    ).join(
-        User, Persona.author_uuid == User.uuid
-    ).filter(
-        Persona.author_uuid.isnot(None)
-    ).group_by(
-        Persona.author_uuid, User.nickname
-    ).all()
-    
-    # 转换为字典格式
-    author_stats = {
-        author_uuid: {
-            'nickname': nickname or 'Unknown',
-            'count': str(count)
-        }
-        for author_uuid, nickname, count in stats if author_uuid
-    }
-    
-    return author_stats
+    return crud_persona.get_author_stats(db=db)
 
 @router.get("/avatar/{user_uuid}", response_model=str)
 def get_user_avatar(
@@ -113,66 +88,37 @@ def get_top_authors(
     Returns:
         List[Dict[str, str]]: 作者列表，包含uuid、nickname和人设数量
     """
-    from sqlalchemy import func
-    from app.db.models.persona import Persona
-    from app.db.models.user import User
-    
-    # 获取每个作者的人设数量并排序
-    stats = db.query(
-        Persona.author_uuid,
-        User.nickname,
-        func.count(Persona.id).label('count')
-    ).join(
-        User, Persona.author_uuid == User.uuid
-    ).filter(
-        Persona.author_uuid.isnot(None)
-    ).group_by(
-        Persona.author_uuid, User.nickname
-    ).order_by(
-        func.count(Persona.id).desc()
-    ).limit(limit).all()
-    
-    # 转换为字典格式
-    result = [
-        {
-            "uuid": author_uuid,
-            "nickname": nickname or 'Unknown',
-            "count": str(count)
-        }
-        for author_uuid, nickname, count in stats
-    ]
-    
-    return result
+    return crud_persona.get_top_authors(db=db, limit=limit)
 
 
-@router.get("/user/{user_uuid}", response_model=Dict[str, str])
+@router.get("/user/{user_uuid}", response_model=UserPublic)
 def get_user_by_uuid(
     *,
     db: Session = Depends(get_db),
     user_uuid: str
-) -> Dict[str, str]:
+) -> UserPublic:
     """
-    根据UUID获取用户信息
+    根据UUID获取用户公开信息
     
     Args:
         db: 数据库会话
         user_uuid: 用户UUID
         
     Returns:
-        Dict[str, str]: 用户信息，包含uuid、username和nickname
+        UserPublic: 用户信息，包含uuid、username和nickname（未设置昵称时为用户名）
         
     Raises:
         HTTPException: 用户不存在时抛出404错误
     """
-    user = crud_user.get_by_uuid(db=db, uuid=user_uuid)
+    user = crud_user.get_public_by_uuid(db=db, uuid=user_uuid)
     if not user:
         raise HTTPException(
             status_code=404,
             detail=f"UUID为 {user_uuid} 的用户不存在"
         )
     
-    return {
-        "uuid": user.uuid,
-        "username": user.username,
-        "nickname": user.nickname or user.username
-    }
\ No newline at end of file
+    return UserPublic(
+        uuid=user.uuid,
+        username=user.username,
+        nickname=user.nickname or user.username
+    )
\ No newline at end of file
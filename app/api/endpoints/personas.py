@@ -3,33 +3,40 @@
 主要功能：Persona相关的API路由端点
 """
 
+import logging
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
 from app.api.deps import get_current_user, get_current_user_optional
 from app.crud.persona import persona as crud_persona
-from app.db.models.persona import Persona
-from app.schemas.user import User
+from app.schemas.user import UserOut
 from app.schemas.persona import (
     PersonaCreate,
     PersonaUpdate,
     PersonaResponse,
     PersonaSearch,
-    PersonaListResponse
+    PersonaListResponse,
+    PersonaSummaryListResponse
 )
 
 # 创建路由
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
+
+# 批量将ORM对象列表转换为响应模式
+_persona_list_adapter = TypeAdapter(List[PersonaResponse])
+
 
 @router.post("/", response_model=PersonaResponse)
 def create_persona(
     *,
     db: Session = Depends(get_db),
     persona_in: PersonaCreate,
-    current_user: User = Depends(get_current_user)
+    current_user: UserOut = Depends(get_current_user)
 ) -> PersonaResponse:
     """
     创建新的人设记录
@@ -43,11 +50,7 @@ def create_persona(
     """
 
     # 检查名称是否已存在
-    existing = db.query(Persona).filter(
-        Persona.name == persona_in.name
-    ).first()
-    
-    if existing:
+    if crud_persona.exists_by_name(db=db, name=persona_in.name):
         raise HTTPException(
             status_code=400,
             detail=f"人设名称 '{persona_in.name}' 已存在"
@@ -55,7 +58,7 @@ def create_persona(
     
     persona_in.author_uuid = current_user.uuid
     persona = crud_persona.create(db=db, obj_in=persona_in)
-    return PersonaResponse.from_db(persona)
+    return PersonaResponse.model_validate(persona)
 
 
 @router.get("/{persona_id}", response_model=PersonaResponse)
@@ -83,7 +86,7 @@ def read_persona(
             status_code=404,
             detail=f"ID为 {persona_id} 的人设记录不存在"
         )
-    return PersonaResponse.from_db(persona)
+    return PersonaResponse.model_validate(persona)
 
 
 @router.get("/", response_model=PersonaListResponse)
@@ -104,14 +107,10 @@ def read_personas(
     Returns:
         PersonaListResponse: 人设列表和总数
     """
-    personas = crud_persona.get_multi(db=db, skip=skip, limit=limit)
-    total = db.query(Persona).count()
-    
-    # 转换为PersonaResponse对象，确保包含author_nickname
-    persona_responses = [PersonaResponse.from_db(persona) for persona in personas]
+    personas, total = crud_persona.get_multi(db=db, skip=skip, limit=limit)
     
     return PersonaListResponse(
-        items=persona_responses,
+        items=personas,
         total=total,
         skip=skip,
         limit=limit
@@ -148,19 +147,14 @@ def update_persona(
     
     # 如果更新名称，检查名称是否已存在
     if persona_in.name and persona_in.name != persona.name:
-        existing = db.query(Persona).filter(
-            Persona.name == persona_in.name,
-            Persona.id != persona_id
-        ).first()
-        
-        if existing:
+        if crud_persona.exists_by_name(db=db, name=persona_in.name, exclude_id=persona_id):
             raise HTTPException(
                 status_code=400,
                 detail=f"人设名称 '{persona_in.name}' 已存在"
             )
     
     persona = crud_persona.update(db=db, db_obj=persona, obj_in=persona_in)
-    return PersonaResponse.from_db(persona)
+    return PersonaResponse.model_validate(persona)
 
 
 @router.delete("/{persona_id}", response_model=PersonaResponse)
@@ -190,7 +184,7 @@ def delete_persona(
         )
     
     persona = crud_persona.remove(db=db, id=persona_id)
-    return PersonaResponse.from_db(persona)
+    return PersonaResponse.model_validate(persona)
 
 
 @router.post("/search", response_model=PersonaListResponse)
@@ -211,11 +205,62 @@ def search_personas(
     """
     personas, total = crud_persona.search(db=db, search_params=search_params)
     
-    # 转换为PersonaResponse对象，确保包含author_nickname
-    persona_responses = [PersonaResponse.from_db(persona) for persona in personas]
-    
     return PersonaListResponse(
-        items=persona_responses,
+        items=personas,
+        total=total,
+        skip=search_params.skip,
+        limit=search_params.limit
+    )
+
+
+@router.get("/summary/list", response_model=PersonaSummaryListResponse)
+def read_persona_summaries(
+    *,
+    db: Session = Depends(get_db),
+    skip: int = Query(0, ge=0, description="跳过记录数"),
+    limit: int = Query(10, ge=1, le=100, description="返回记录数限制")
+) -> PersonaSummaryListResponse:
+    """
+    获取人设精简列表（分页），不返回人设内容、扩展数据与 Base64 头像
+    
+    Args:
+        db: 数据库会话
+        skip: 跳过记录数
+        limit: 返回记录数限制
+        
+    Returns:
+        PersonaSummaryListResponse: 人设精简列表和总数
+    """
+    personas, total = crud_persona.get_multi_summary(db=db, skip=skip, limit=limit)
+    
+    return PersonaSummaryListResponse(
+        items=personas,
+        total=total,
+        skip=skip,
+        limit=limit
+    )
+
+
+@router.post("/summary/search", response_model=PersonaSummaryListResponse)
+def search_persona_summaries(
+    *,
+    db: Session = Depends(get_db),
+    search_params: PersonaSearch
+) -> PersonaSummaryListResponse:
+    """
+    搜索人设记录，返回精简信息（不含人设内容、扩展数据与 Base64 头像）
+    
+    Args:
+        db: 数据库会话
+        search_params: 搜索参数
+        
+    Returns:
+        PersonaSummaryListResponse: 搜索结果精简列表和总数
+    """
+    personas, total = crud_persona.search_summary(db=db, search_params=search_params)
+    
+    return PersonaSummaryListResponse(
+        items=personas,
         total=total,
         skip=search_params.skip,
         limit=search_params.limit
@@ -242,21 +287,15 @@ def get_personas_by_author_uuid(
     Returns:
         PersonaListResponse: 人设列表和总数
     """
-    personas = crud_persona.get_by_author_uuid(
+    personas, total = crud_persona.get_by_author_uuid(
         db=db,
         author_uuid=author_uuid,
         skip=skip,
         limit=limit
     )
     
-    # 计算总数
-    total = db.query(Persona).filter(Persona.author_uuid == author_uuid).count()
-    
-    # 转换为PersonaResponse对象
-    persona_responses = [PersonaResponse.from_db(p) for p in personas]
-    
     return PersonaListResponse(
-        items=persona_responses,
+        items=personas,
         total=total,
         skip=skip,
         limit=limit
@@ -268,7 +307,7 @@ def increment_persona_view(
     *,
     db: Session = Depends(get_db),
     persona_id: int,
-    current_user: Optional[User] = Depends(get_current_user_optional)
+    current_user: Optional[UserOut] = Depends(get_current_user_optional)
 ) -> PersonaResponse:
     """
     增加人设浏览量（仅当访问者不是作者时）
@@ -299,15 +338,15 @@ def increment_persona_view(
     )
     
     if not is_author:
-        # 仅当访问者不是作者时才增加浏览量
-        persona.view_count = (persona.view_count or 0) + 1
-        db.commit()
-        db.refresh(persona)
-        print(f"人设 ID {persona_id} 浏览量已增加至 {persona.view_count}")
+        # 仅当访问者不是作者时才增加浏览量，增量先暂存在内存中，由后台任务定期写回
+        pending = crud_persona.queue_view(id=persona_id)
     else:
-        print(f"作者访问自己的人设 ID {persona_id}，不增加浏览量")
+        pending = crud_persona.get_pending_views(id=persona_id)
+        logger.debug("作者访问自己的人设 ID %s，不增加浏览量", persona_id)
     
-    return PersonaResponse.from_db(persona)
+    response = PersonaResponse.model_validate(persona)
+    response.view_count = (persona.view_count or 0) + pending
+    return response
 
 
 @router.get("/tags/{tags}", response_model=List[PersonaResponse])
@@ -336,5 +375,4 @@ def get_personas_by_tags(
         skip=skip, 
         limit=limit
     )
-    # 转换为PersonaResponse对象，确保包含author_nickname
-    return [PersonaResponse.from_db(persona) for persona in personas]
\ No newline at end of file
+    return _persona_list_adapter.validate_python(personas)
\ No newline at end of file
@@ -43,25 +43,11 @@ def get_tag_stats(
         db: 数据库会话
         
     Returns:
-        dict: 标签统计信息，包含标签使用次数
+        dict: 标签统计信息，包含标签使用次数（按使用次数降序）
     """
-    from sqlalchemy import func
-    from app.db.models.persona import Persona
-    
-    # 获取所有记录的标签
-    records = db.query(Persona.tags).filter(Persona.tags.isnot(None)).all()
-    
-    tag_counts = {}
-    for tag_str in records:
-        if tag_str[0]:
-            tags = [t.strip() for t in tag_str[0].split(',') if t.strip()]
-            for tag in tags:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
-    
-    # 按使用次数排序
-    sorted_tags = dict(sorted(tag_counts.items(), key=lambda x: x[1], reverse=True))
+    tag_counts = crud_persona.get_tag_stats(db=db)
     
     return {
-        "total_tags": len(sorted_tags),
-        "tag_counts": sorted_tags
+        "total_tags": len(tag_counts),
+        "tag_counts": tag_counts
     }
\ No newline at end of file
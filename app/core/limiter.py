@@ -0,0 +1,10 @@
+"""
+模块名称：limiter.py
+主要功能：提供基于客户端IP的接口限流器
+"""
+
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+# 全局限流器，在 main.py 中注册到应用
+limiter = Limiter(key_func=get_remote_address)
@@ -3,15 +3,96 @@
 主要功能：提供密码哈希、JWT生成与验证等安全相关功能
 """
 
+import hashlib
+import hmac
+import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, Union
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple, TypeVar, Union
 
-from jose import jwt
+import anyio
+import jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+logger = logging.getLogger(__name__)
+
+# JWT 密钥（预先编码为字节）与算法在导入时固定，签发令牌时不再逐次读取配置
+_SECRET_KEY = settings.SECRET_KEY.encode()
+_ALGORITHM = settings.ALGORITHM
+
+# 新密码使用 Argon2id（OWASP 推荐参数），旧的 bcrypt 哈希在登录成功后自动升级
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__memory_cost=65536,
+    argon2__time_cost=3,
+    argon2__parallelism=2,
+    bcrypt__rounds=12,
+)
+
+
+def _pepper(password: str) -> str:
+    """使用服务端密钥对密码做 HMAC-SHA256，数据库泄露时无法离线爆破
+
+    Args:
+        password (str): 明文密码。
+
+    Returns:
+        str: 加入 pepper 后的密码；未配置 PASSWORD_PEPPER 时原样返回。
+    """
+    if not settings.PASSWORD_PEPPER:
+        return password
+    return hmac.new(
+        settings.PASSWORD_PEPPER.encode(),
+        password.encode(),
+        hashlib.sha256
+    ).hexdigest()
+
+
+
+def pepper_enabled() -> bool:
+    """当前是否启用了 pepper，即新生成的哈希是否包含 pepper
+
+    Returns:
+        bool: 已配置 PASSWORD_PEPPER 时为 True。
+    """
+    return bool(settings.PASSWORD_PEPPER)
+
+
+T = TypeVar("T")
+
+# 密码哈希校验专用的线程配额，避免突发登录占满默认线程池、阻塞数据库请求
+_hash_limiter: Optional[anyio.CapacityLimiter] = None
+
+
+def _get_hash_limiter() -> anyio.CapacityLimiter:
+    """获取密码哈希线程配额，首次使用时在事件循环中创建"""
+    global _hash_limiter
+    if _hash_limiter is None:
+        _hash_limiter = anyio.CapacityLimiter(settings.PASSWORD_HASH_WORKERS)
+    return _hash_limiter
+
+
+async def run_password_task(func: Callable[..., T], *args: Any) -> T:
+    """在独立的线程配额中执行密码哈希相关的 CPU 密集操作
+
+    Args:
+        func (Callable[..., T]): 要执行的函数，如 verify_and_update_password。
+        *args (Any): 传给函数的位置参数。
+
+    Returns:
+        T: 函数的返回值。
+    """
+    return await anyio.to_thread.run_sync(func, *args, limiter=_get_hash_limiter())
+
+
+@lru_cache(maxsize=1)
+def _dummy_hash() -> str:
+    """用于用户不存在时的校验，首次使用时生成"""
+    return get_password_hash("dummy-password")
 
 
 def create_access_token(
@@ -32,21 +113,62 @@ def create_access_token(
     else:
         expire = datetime.now(timezone(timedelta(hours=8))) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode = {"exp": expire, "sub": str(subject)}
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SECRET_KEY, algorithm=_ALGORITHM)
     return encoded_jwt
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def verify_password(plain_password: str, hashed_password: str, peppered: bool = True) -> bool:
     """验证密码
 
     Args:
         plain_password (str): 明文密码。
         hashed_password (str): 哈希密码。
+        peppered (bool): 该哈希生成时是否加入了 pepper（用户记录上的 password_peppered）。
 
     Returns:
         bool: 密码是否匹配。
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return pwd_context.verify(_pepper(plain_password) if peppered else plain_password, hashed_password)
+
+
+def verify_and_update_password(
+    plain_password: str,
+    hashed_password: str,
+    peppered: bool
+) -> Tuple[bool, Optional[str]]:
+    """验证密码，并在哈希算法、参数过时或缺少 pepper 时生成新的哈希
+
+    哈希是否包含 pepper 由用户记录上的 password_peppered 标记决定，无需试算；
+    每次调用只做一次哈希校验，与 verify_dummy_password 的耗时一致。
+
+    Args:
+        plain_password (str): 明文密码。
+        hashed_password (str): 哈希密码。
+        peppered (bool): 该哈希生成时是否加入了 pepper。
+
+    Returns:
+        Tuple[bool, Optional[str]]: 密码是否匹配，以及需要替换的新哈希（无需更新时为None）。
+    """
+    if peppered and not pepper_enabled():
+        # 哈希包含 pepper 但当前未配置 PASSWORD_PEPPER：该用户无法登录，属于配置错误
+        logger.error("用户密码哈希包含 pepper，但未配置 PASSWORD_PEPPER，密码校验必然失败")
+    if pepper_enabled() and not peppered:
+        # 启用 pepper 之前生成的旧哈希：按原始密码校验，通过后换成含 pepper 的新哈希
+        if pwd_context.verify(plain_password, hashed_password):
+            return True, get_password_hash(plain_password)
+        return False, None
+    return pwd_context.verify_and_update(_pepper(plain_password), hashed_password)
+
+
+def verify_dummy_password(plain_password: str) -> None:
+    """对固定的哈希执行一次校验，使“用户不存在”与“密码错误”的耗时一致
+
+    与 verify_and_update_password 相同，只做一次哈希校验。
+
+    Args:
+        plain_password (str): 明文密码。
+    """
+    pwd_context.verify(_pepper(plain_password), _dummy_hash())
 
 
 def get_password_hash(password: str) -> str:
@@ -58,4 +180,4 @@ def get_password_hash(password: str) -> str:
     Returns:
         str: 密码的哈希值。
     """
-    return pwd_context.hash(password)
\ No newline at end of file
+    return pwd_context.hash(_pepper(password))
\ No newline at end of file
@@ -3,14 +3,130 @@
 主要功能：Persona的CRUD操作实现
 """
 
-from typing import List, Optional
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, and_
-from app.db.models.persona import Persona, PersonaAvatar
+import threading
+from collections import Counter
+from typing import Dict, List, Optional
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
+from sqlalchemy.orm import Query, Session, joinedload, load_only, raiseload, selectinload
+from sqlalchemy import or_, and_, bindparam, exists, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.mysql import match
+from app.core.config import settings
+from app.db.models.persona import Persona, PersonaAvatar, PersonaTag, Tag
 from app.db.models.user import User
 from app.schemas.persona import PersonaCreate, PersonaUpdate, PersonaSearch
 
 
+# 标签、作者等聚合查询结果的缓存，人设发生写操作时整体失效
+_aggregate_cache: TTLCache = TTLCache(maxsize=64, ttl=60)
+_aggregate_cache_lock = threading.Lock()
+
+
+def _invalidate_aggregates() -> None:
+    """清空聚合查询缓存"""
+    with _aggregate_cache_lock:
+        _aggregate_cache.clear()
+
+
+# 读取人设时显式声明需要的关系，其余关系一律禁止懒加载，遗漏的关系会直接报错而不是逐行查询（N+1）
+# Base64 头像列默认延迟加载，完整响应需要返回头像，因此在这里显式 undefer
+# 单条记录：头像直接 JOIN 进主查询
+_READ_OPTIONS = (
+    selectinload(Persona.author),
+    joinedload(Persona.avatar_rel).undefer(PersonaAvatar.base64),
+    raiseload('*'),
+)
+
+# 列表：作者与头像均以 IN 查询批量加载，分页主查询不携带关联表的列
+_LIST_OPTIONS = (
+    selectinload(Persona.author),
+    selectinload(Persona.avatar_rel).undefer(PersonaAvatar.base64),
+    raiseload('*'),
+)
+
+# 精简列表只读取展示所需的列，正文、扩展数据与 Base64 头像均不加载（访问即报错）
+_SUMMARY_OPTIONS = (
+    load_only(
+        Persona.id,
+        Persona.uuid,
+        Persona.view_count,
+        Persona.name,
+        Persona.title,
+        Persona.avatar,
+        Persona.description,
+        Persona.tags,
+        Persona.author_uuid,
+        Persona.create_time,
+        Persona.update_time,
+        raiseload=True
+    ),
+    selectinload(Persona.author),
+    raiseload('*'),
+)
+
+
+def _split_tags(tags: Optional[str]) -> List[str]:
+    """
+    拆分逗号分隔的标签字符串，去除空白与重复项（不区分大小写，保留首次出现的写法）
+    
+    Args:
+        tags: 标签字符串
+        
+    Returns:
+        List[str]: 标签名称列表
+    """
+    names: Dict[str, str] = {}
+    for tag in (tags or "").split(','):
+        tag = tag.strip()
+        if tag:
+            names.setdefault(tag.casefold(), tag)
+    return list(names.values())
+
+
+def _tags_filter(tag_names: List[str]):
+    """
+    构造“同时包含所有标签”的筛选条件：每个标签一个走索引的 EXISTS 子查询，合并为一个 AND 条件
+    
+    Args:
+        tag_names: 标签名称列表（非空）
+        
+    Returns:
+        过滤条件表达式
+    """
+    return and_(*[Persona.tag_rel.any(Tag.name == tag) for tag in tag_names])
+
+
+def _is_url(value: str) -> bool:
+    """
+    判断头像字符串是否为 http(s) URL（否则视为 base64 数据）
+    
+    Args:
+        value: 头像字符串
+        
+    Returns:
+        bool: 是否为 URL
+    """
+    return value.startswith(("http://", "https://"))
+
+
+# MySQL ngram 全文解析器的默认分词长度（ngram_token_size），更短的关键词无法命中全文索引
+_NGRAM_TOKEN_SIZE = 2
+
+
+# 尚未写回数据库的浏览量增量（按人设ID聚合），由后台任务定期批量写回
+_pending_views: Counter = Counter()
+_pending_views_lock = threading.Lock()
+
+# 写回浏览量增量的语句，基于表而非 ORM 实体构造，以便一次 executemany 提交所有参数
+_personas_table = Persona.__table__
+_FLUSH_VIEWS_STMT = (
+    update(_personas_table)
+    .where(_personas_table.c.id == bindparam("persona_id"))
+    .values(view_count=func.coalesce(_personas_table.c.view_count, 0) + bindparam("delta"))
+)
+
+
 class CRUDPersona:
     """
     Persona的CRUD操作类
@@ -29,30 +145,72 @@ class CRUDPersona:
         Returns:
             Persona: 创建的记录对象
         """
-        import re
         obj_in_data = obj_in.model_dump(exclude_unset=True)
         avatar_str = obj_in_data.pop('avatar', None)
 
         # 创建 Persona 对象，但不包括 avatar
         db_obj = Persona(**obj_in_data)
 
-        # 如果 avatar 是 URL，则直接赋值
-        if avatar_str and re.match(r'^https?://', avatar_str):
+        if avatar_str and _is_url(avatar_str):
+            # 如果 avatar 是 URL，则直接赋值
             db_obj.avatar = avatar_str
+        elif avatar_str:
+            # 如果 avatar 是 base64，则通过关系挂上 PersonaAvatar，外键在 flush 时自动填充
+            db_obj.avatar_rel = PersonaAvatar(base64=avatar_str)
         
+        # 人设、头像与标签关联在同一个事务中写入；先 flush 以生成 uuid
         db.add(db_obj)
+        db.flush()
+        self._sync_tags(db, persona_uuid=db_obj.uuid, tags=db_obj.tags)
+        persona_id = db_obj.id
         db.commit()
-        db.refresh(db_obj)
-
-        # 如果 avatar 是 base64，则创建 PersonaAvatar 记录
-        if avatar_str and not re.match(r'^https?://', avatar_str):
-            avatar = PersonaAvatar(persona_uuid=db_obj.uuid, base64=avatar_str)
-            db.add(avatar)
-            db.commit()
-            db.refresh(db_obj)
-            
+        db_obj = self._reload(db, persona_id)
+        
+        _invalidate_aggregates()
         return db_obj
     
+    def invalidate_cache(self) -> None:
+        """
+        清空标签、作者等聚合查询缓存，作者昵称等关联数据变更后调用
+        """
+        _invalidate_aggregates()
+    
+    def _sync_tags(self, db: Session, *, persona_uuid: str, tags: Optional[str]) -> None:
+        """
+        按标签字符串重建人设的标签关联，不存在的标签会被创建（不提交事务）
+        
+        Args:
+            db: 数据库会话
+            persona_uuid: 人设UUID
+            tags: 标签字符串（逗号分隔）
+        """
+        db.query(PersonaTag).filter(
+            PersonaTag.persona_uuid == persona_uuid
+        ).delete(synchronize_session=False)
+        
+        names = _split_tags(tags)
+        if not names:
+            return
+        
+        # 两个标签名是否相同以数据库排序规则为准（MySQL 的 _ai_ci 还会忽略重音），不在 Python 中比较：
+        # 缺失的名称逐个在保存点内插入，与已有标签或并发请求冲突时跳过，最后按名称重新查询标签ID
+        existing = set(db.scalars(select(Tag.name).where(Tag.name.in_(names))))
+        for name in names:
+            if name in existing:
+                continue
+            try:
+                with db.begin_nested():
+                    db.add(Tag(name=name))
+            except IntegrityError:
+                pass
+        
+        # 多个名称可能对应同一个标签，按标签ID去重，避免违反 persona_tags 主键
+        tag_ids = set(db.scalars(select(Tag.id).where(Tag.name.in_(names))))
+        db.add_all([
+            PersonaTag(persona_uuid=persona_uuid, tag_id=tag_id)
+            for tag_id in tag_ids
+        ])
+    
     def get(self, db: Session, id: int) -> Optional[Persona]:
         """
         根据ID获取人设记录
@@ -64,7 +222,70 @@ class CRUDPersona:
         Returns:
             Optional[Persona]: 记录对象或None
         """
-        return db.query(Persona).options(joinedload(Persona.author)).filter(Persona.id == id).first()
+        return db.query(Persona).options(*_READ_OPTIONS).filter(Persona.id == id).first()
+    
+    def _reload(self, db: Session, id: int) -> Persona:
+        """
+        写入提交后重新加载人设，与 get 使用相同的加载选项
+        
+        db.refresh 不会加载延迟列，响应序列化时会再单独查询 Base64 头像；
+        这里一次查询带回头像与作者，并覆盖身份映射中已过期的对象。
+        调用方需在提交前取得ID，提交后访问过期对象的属性会触发一次多余的刷新查询。
+        
+        Args:
+            db: 数据库会话
+            id: 记录ID
+            
+        Returns:
+            Persona: 重新加载的记录对象
+        """
+        return db.execute(
+            select(Persona)
+            .options(*_READ_OPTIONS)
+            .where(Persona.id == id)
+            .execution_options(populate_existing=True)
+        ).unique().scalar_one()
+    
+    def exists_by_name(self, db: Session, *, name: str, exclude_id: Optional[int] = None) -> bool:
+        """
+        判断人设名称是否已被使用
+        
+        Args:
+            db: 数据库会话
+            name: 人设名称
+            exclude_id: 需要排除的人设ID（更新时排除自身）
+            
+        Returns:
+            bool: 名称是否已存在
+        """
+        conditions = [Persona.name == name]
+        if exclude_id is not None:
+            conditions.append(Persona.id != exclude_id)
+        return db.scalar(select(exists().where(*conditions)))
+    
+    def _paginate(
+        self,
+        query: Query,
+        *,
+        skip: int,
+        limit: int
+    ) -> tuple[List[Persona], int]:
+        """
+        分页查询，通过 COUNT(*) OVER () 窗口函数在同一次查询中返回总数
+        
+        Args:
+            query: Persona查询对象
+            skip: 跳过记录数
+            limit: 限制记录数
+            
+        Returns:
+            tuple[List[Persona], int]: 记录列表和总数
+        """
+        rows = query.add_columns(func.count().over().label("total")).offset(skip).limit(limit).all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        # 偏移量超出结果范围时没有返回行，需要单独计算总数
+        return [], query.count() if skip else 0
     
     def get_multi(
         self, 
@@ -72,7 +293,7 @@ class CRUDPersona:
         *, 
         skip: int = 0, 
         limit: int = 100
-    ) -> List[Persona]:
+    ) -> tuple[List[Persona], int]:
         """
         获取多个人设记录（分页）
         
@@ -82,9 +303,31 @@ class CRUDPersona:
             limit: 限制记录数
             
         Returns:
-            List[Persona]: 记录列表
+            tuple[List[Persona], int]: 记录列表和总数
         """
-        return db.query(Persona).options(joinedload(Persona.author)).offset(skip).limit(limit).all()
+        query = db.query(Persona).options(*_LIST_OPTIONS)
+        return self._paginate(query, skip=skip, limit=limit)
+    
+    def get_multi_summary(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100
+    ) -> tuple[List[Persona], int]:
+        """
+        获取人设精简列表（不加载正文、扩展数据与 Base64 头像）
+        
+        Args:
+            db: 数据库会话
+            skip: 跳过记录数
+            limit: 限制记录数
+            
+        Returns:
+            tuple[List[Persona], int]: 记录列表和总数
+        """
+        query = db.query(Persona).options(*_SUMMARY_OPTIONS)
+        return self._paginate(query, skip=skip, limit=limit)
     
     def search(
         self,
@@ -102,39 +345,93 @@ class CRUDPersona:
         Returns:
             tuple[List[Persona], int]: 记录列表和总数
         """
+        query = self._search_query(db, search_params).options(*_LIST_OPTIONS)
+        return self._paginate(query, skip=search_params.skip, limit=search_params.limit)
+    
+    def search_summary(
+        self,
+        db: Session,
+        *,
+        search_params: PersonaSearch
+    ) -> tuple[List[Persona], int]:
+        """
+        搜索人设记录，返回精简信息（不加载正文、扩展数据与 Base64 头像）
+        
+        Args:
+            db: 数据库会话
+            search_params: 搜索参数
+            
+        Returns:
+            tuple[List[Persona], int]: 记录列表和总数
+        """
+        query = self._search_query(db, search_params).options(*_SUMMARY_OPTIONS)
+        return self._paginate(query, skip=search_params.skip, limit=search_params.limit)
+    
+    def _search_query(self, db: Session, search_params: PersonaSearch) -> Query:
+        """
+        根据搜索参数构造查询条件
+        
+        Args:
+            db: 数据库会话
+            search_params: 搜索参数
+            
+        Returns:
+            Query: 未分页的Persona查询对象
+        """
         query = db.query(Persona)
         
         # 关键词搜索
         if search_params.keyword:
-            keyword_filter = f"%{search_params.keyword}%"
-            query = query.filter(
-                or_(
-                    Persona.name.like(keyword_filter),
-                    Persona.description.like(keyword_filter),
-                    Persona.content.like(keyword_filter)
-                )
-            )
+            query = query.filter(self._keyword_filter(db, search_params.keyword))
         
         # 标签筛选
         if search_params.tags:
-            tags = [tag.strip() for tag in search_params.tags.split(',') if tag.strip()]
-            for tag in tags:
-                query = query.filter(Persona.tags.like(f"%{tag}%"))
+            tag_names = _split_tags(search_params.tags)
+            if tag_names:
+                query = query.filter(_tags_filter(tag_names))
         
         # 作者筛选
         if search_params.author_uuid:
             query = query.filter(Persona.author_uuid == search_params.author_uuid)
         
-        # 添加作者信息关联
-        query = query.options(joinedload(Persona.author))
+        return query
+    
+    def _keyword_filter(self, db: Session, keyword: str):
+        """
+        构造关键词搜索条件
         
-        # 计算总数
-        total = query.count()
+        MySQL 下使用 ngram 全文索引做短语匹配（MATCH ... AGAINST），
+        其他数据库或短于 ngram 分词长度的关键词回退为 LIKE 子串匹配。
         
-        # 分页
-        records = query.offset(search_params.skip).limit(search_params.limit).all()
+        Args:
+            db: 数据库会话
+            keyword: 搜索关键词
+            
+        Returns:
+            过滤条件表达式
+        """
+        phrase = keyword.replace('"', '').strip()
+        if (
+            settings.FULLTEXT_SEARCH
+            and len(phrase) >= _NGRAM_TOKEN_SIZE
+            and db.get_bind().dialect.name == "mysql"
+        ):
+            # 列的顺序与集合必须与全文索引 ix_personas_fulltext 完全一致
+            return match(
+                Persona.name,
+                Persona.title,
+                Persona.description,
+                Persona.content,
+                against=f'"{phrase}"'
+            ).in_boolean_mode()
         
-        return records, total
+        keyword_filter = f"%{keyword}%"
+        return or_(
+            Persona.name.like(keyword_filter),
+            Persona.title.like(keyword_filter),
+            Persona.description.like(keyword_filter),
+            Persona.content.like(keyword_filter)
+        )
     
     def get_by_author_uuid(
         self, 
@@ -143,7 +440,7 @@ class CRUDPersona:
         author_uuid: str, 
         skip: int = 0, 
         limit: int = 100
-    ) -> List[Persona]:
+    ) -> tuple[List[Persona], int]:
         """
         根据作者UUID获取人设记录
         
@@ -154,11 +451,12 @@ class CRUDPersona:
             limit: 限制记录数
             
         Returns:
-            List[Persona]: 记录列表
+            tuple[List[Persona], int]: 记录列表和总数
         """
-        return db.query(Persona).options(joinedload(Persona.author)).filter(
+        query = db.query(Persona).options(*_LIST_OPTIONS).filter(
             Persona.author_uuid == author_uuid
-        ).offset(skip).limit(limit).all()
+        )
+        return self._paginate(query, skip=skip, limit=limit)
     
     def get_by_tags(
         self, 
@@ -180,13 +478,13 @@ class CRUDPersona:
         Returns:
             List[Persona]: 记录列表
         """
-        tag_list = [tag.strip() for tag in tags.split(',') if tag.strip()]
-        query = db.query(Persona)
+        query = db.query(Persona).options(*_LIST_OPTIONS)
         
-        for tag in tag_list:
-            query = query.filter(Persona.tags.like(f"%{tag}%"))
+        tag_names = _split_tags(tags)
+        if tag_names:
+            query = query.filter(_tags_filter(tag_names))
         
-        return query.options(joinedload(Persona.author)).offset(skip).limit(limit).all()
+        return query.offset(skip).limit(limit).all()
     
     def update(
         self,
@@ -206,35 +504,96 @@ class CRUDPersona:
         Returns:
             Persona: 更新后的记录对象
         """
-        import re
         update_data = obj_in.model_dump(exclude_unset=True)
 
         if 'avatar' in update_data:
             avatar_str = update_data.pop('avatar')
             
             # 如果是 base64 编码
-            if avatar_str and not re.match(r'^https?://', avatar_str):
+            if avatar_str and not _is_url(avatar_str):
                 db_obj.avatar = None  # 清空旧的 URL
                 if db_obj.avatar_rel:
                     db_obj.avatar_rel.base64 = avatar_str
                 else:
-                    new_avatar = PersonaAvatar(persona_uuid=db_obj.uuid, base64=avatar_str)
-                    db.add(new_avatar)
+                    db_obj.avatar_rel = PersonaAvatar(base64=avatar_str)
             # 如果是 URL
             else:
                 db_obj.avatar = avatar_str
-                # 如果存在旧的 base64 头像，则删除
-                if db_obj.avatar_rel:
-                    db.delete(db_obj.avatar_rel)
+                # 如果存在旧的 base64 头像，解除关联后由 delete-orphan 级联删除
+                db_obj.avatar_rel = None
 
         for field, value in update_data.items():
             setattr(db_obj, field, value)
         
+        if 'tags' in update_data:
+            self._sync_tags(db, persona_uuid=db_obj.uuid, tags=db_obj.tags)
+        
+        # 字段修改、头像与标签关联的增删在同一个事务中提交
         db.add(db_obj)
+        persona_id = db_obj.id
         db.commit()
-        db.refresh(db_obj)
+        db_obj = self._reload(db, persona_id)
+        _invalidate_aggregates()
         return db_obj
     
+    def queue_view(self, *, id: int) -> int:
+        """
+        记录一次浏览，增量暂存在内存中，由 flush_views 批量写回
+        
+        Args:
+            id: 记录ID
+            
+        Returns:
+            int: 该人设尚未写回数据库的浏览量增量
+        """
+        with _pending_views_lock:
+            _pending_views[id] += 1
+            return _pending_views[id]
+    
+    def get_pending_views(self, *, id: int) -> int:
+        """
+        获取人设尚未写回数据库的浏览量增量
+        
+        Args:
+            id: 记录ID
+            
+        Returns:
+            int: 浏览量增量
+        """
+        with _pending_views_lock:
+            return _pending_views.get(id, 0)
+    
+    def flush_views(self, db: Session) -> int:
+        """
+        将暂存的浏览量增量写回数据库（同一条 UPDATE 以 executemany 批量执行，同一事务提交）
+        
+        写回失败时增量会放回缓冲区，等待下次写回。
+        
+        Args:
+            db: 数据库会话
+            
+        Returns:
+            int: 写回的人设数量
+        """
+        with _pending_views_lock:
+            pending = dict(_pending_views)
+            _pending_views.clear()
+        if not pending:
+            return 0
+        
+        try:
+            db.execute(_FLUSH_VIEWS_STMT, [
+                {"persona_id": persona_id, "delta": delta}
+                for persona_id, delta in pending.items()
+            ])
+            db.commit()
+        except Exception:
+            db.rollback()
+            with _pending_views_lock:
+                _pending_views.update(pending)
+            raise
+        return len(pending)
+    
     def remove(self, db: Session, *, id: int) -> Optional[Persona]:
         """
         删除人设记录
@@ -246,12 +605,19 @@ class CRUDPersona:
         Returns:
             Optional[Persona]: 被删除的记录对象或None
         """
-        obj = db.query(Persona).filter(Persona.id == id).first()
+        # 删除后对象脱离会话，无法再懒加载，需在删除前加载响应所需的作者与头像
+        obj = self.get(db, id)
         if obj:
+            # 外键已设置级联删除，这里显式删除以兼容未启用外键约束的数据库（如 SQLite）
+            db.query(PersonaTag).filter(
+                PersonaTag.persona_uuid == obj.uuid
+            ).delete(synchronize_session=False)
             db.delete(obj)
             db.commit()
+            _invalidate_aggregates()
         return obj
     
+    @cached(_aggregate_cache, key=lambda self, db: hashkey("authors"), lock=_aggregate_cache_lock)
     def get_authors(self, db: Session) -> List[dict]:
         """
         获取所有不重复的作者列表（包含UUID和昵称）
@@ -269,9 +635,10 @@ class CRUDPersona:
         ).distinct().all()
         return [{'uuid': author[0], 'nickname': author[1]} for author in authors if author[0]]
     
+    @cached(_aggregate_cache, key=lambda self, db: hashkey("tags"), lock=_aggregate_cache_lock)
     def get_all_tags(self, db: Session) -> List[str]:
         """
-        获取所有不重复的标签列表
+        获取所有被人设使用的不重复标签列表，去重与排序在数据库中完成
         
         Args:
             db: 数据库会话
@@ -279,17 +646,97 @@ class CRUDPersona:
         Returns:
             List[str]: 标签列表
         """
-        tags = db.query(Persona.tags).filter(
-            Persona.tags.isnot(None)
+        rows = db.query(Tag.name).join(
+            PersonaTag, PersonaTag.tag_id == Tag.id
+        ).distinct().order_by(Tag.name).all()
+        return [tag[0] for tag in rows]
+    
+    @cached(_aggregate_cache, key=lambda self, db: hashkey("tag_stats"), lock=_aggregate_cache_lock)
+    def get_tag_stats(self, db: Session) -> dict:
+        """
+        统计每个标签的使用次数，基于 persona_tags 关联表分组计数
+        
+        Args:
+            db: 数据库会话
+            
+        Returns:
+            dict: 标签到使用次数的映射（按使用次数降序）
+        """
+        usage_count = func.count(PersonaTag.persona_uuid)
+        rows = db.query(Tag.name, usage_count).join(
+            PersonaTag, PersonaTag.tag_id == Tag.id
+        ).group_by(
+            Tag.id, Tag.name
+        ).order_by(
+            usage_count.desc(), Tag.name
+        ).all()
+        return {tag: count for tag, count in rows}
+    
+    @cached(_aggregate_cache, key=lambda self, db: hashkey("author_stats"), lock=_aggregate_cache_lock)
+    def get_author_stats(self, db: Session) -> Dict[str, Dict[str, str]]:
+        """
+        获取每个作者的人设数量和昵称
+        
+        Args:
+            db: 数据库会话
+            
+        Returns:
+            Dict[str, Dict[str, str]]: 以作者UUID为键的统计信息
+        """
+        stats = db.query(
+            Persona.author_uuid,
+            User.nickname,
+            func.count(Persona.id).label('count')
+        ).join(
+            User, Persona.author_uuid == User.uuid
+        ).filter(
+            Persona.author_uuid.isnot(None)
+        ).group_by(
+            Persona.author_uuid, User.nickname
         ).all()
         
-        all_tags = set()
-        for tag_str in tags:
-            if tag_str[0]:
-                tag_list = [t.strip() for t in tag_str[0].split(',') if t.strip()]
-                all_tags.update(tag_list)
+        return {
+            author_uuid: {
+                'nickname': nickname or 'Unknown',
+                'count': str(count)
+            }
+            for author_uuid, nickname, count in stats if author_uuid
+        }
+    
+    @cached(_aggregate_cache, key=lambda self, db, *, limit=10: hashkey("top_authors", limit), lock=_aggregate_cache_lock)
+    def get_top_authors(self, db: Session, *, limit: int = 10) -> List[Dict[str, str]]:
+        """
+        获取创作数量最多的作者列表
+        
+        Args:
+            db: 数据库会话
+            limit: 返回作者数量限制
+            
+        Returns:
+            List[Dict[str, str]]: 作者列表，包含uuid、nickname和人设数量
+        """
+        stats = db.query(
+            Persona.author_uuid,
+            User.nickname,
+            func.count(Persona.id).label('count')
+        ).join(
+            User, Persona.author_uuid == User.uuid
+        ).filter(
+            Persona.author_uuid.isnot(None)
+        ).group_by(
+            Persona.author_uuid, User.nickname
+        ).order_by(
+            func.count(Persona.id).desc()
+        ).limit(limit).all()
         
-        return sorted(list(all_tags))
+        return [
+            {
+                "uuid": author_uuid,
+                "nickname": nickname or 'Unknown',
+                "count": str(count)
+            }
+            for author_uuid, nickname, count in stats
+        ]
 
 
 # 创建全局CRUD实例
@@ -3,15 +3,19 @@
 主要功能：提供用户相关的CRUD操作
 """
 
-from sqlalchemy import or_
+from typing import Any, Dict, Optional
+
+from sqlalchemy import Row, exists, select, update
 from sqlalchemy.orm import Session
 from app.db.models.user import User, AuthorAvatar
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash, pepper_enabled
 
 
 class CRUDUser:
     """用户CRUD操作类
+
+    按唯一列查询时使用 2.0 风格的 select()，按主键查询时使用 Session.get 以命中标识映射。
     """
     def get_avatar(self, db: Session, user_uuid: str) -> str | None:
         """获取用户的头像的Base64编码
@@ -23,9 +27,22 @@ class CRUDUser:
         Returns:
             str | None: 头像的Base64编码或None
         """
-        avatar_obj = db.query(AuthorAvatar).filter(AuthorAvatar.user_uuid == user_uuid).first()
-        return avatar_obj.base64 if avatar_obj else None
+        return db.execute(
+            select(AuthorAvatar.base64).where(AuthorAvatar.user_uuid == user_uuid)
+        ).scalar_one_or_none()
     
+    def get(self, db: Session, id: int) -> User | None:
+        """根据ID获取用户
+
+        Args:
+            db (Session): 数据库会话。
+            id (int): 用户ID。
+
+        Returns:
+            User | None: 用户对象或None。
+        """
+        return db.get(User, id)
+
     def get_by_email(self, db: Session, email: str) -> User | None:
         """根据邮箱获取用户
 
@@ -36,7 +53,50 @@ class CRUDUser:
         Returns:
             User | None: 用户对象或None。
         """
-        return db.query(User).filter(User.email == email).first()
+        return db.execute(select(User).where(User.email == email)).scalar_one_or_none()
+
+    def exists_by_email(self, db: Session, email: str, exclude_id: Optional[int] = None) -> bool:
+        """判断邮箱是否已被使用
+
+        Args:
+            db (Session): 数据库会话。
+            email (str): 用户邮箱。
+            exclude_id (Optional[int]): 需要排除的用户ID（更新时排除自身）。
+
+        Returns:
+            bool: 邮箱是否已存在。
+        """
+        conditions = [User.email == email]
+        if exclude_id is not None:
+            conditions.append(User.id != exclude_id)
+        return db.scalar(select(exists().where(*conditions)))
+
+    def exists_peppered(self, db: Session) -> bool:
+        """检查是否存在密码哈希包含 pepper 的用户
+
+        Args:
+            db (Session): 数据库会话。
+
+        Returns:
+            bool: 是否存在 password_peppered 为真的用户。
+        """
+        return db.scalar(select(exists().where(User.password_peppered.is_(True))))
+
+    def exists_by_username(self, db: Session, username: str, exclude_id: Optional[int] = None) -> bool:
+        """判断用户名是否已被使用
+
+        Args:
+            db (Session): 数据库会话。
+            username (str): 用户名。
+            exclude_id (Optional[int]): 需要排除的用户ID（更新时排除自身）。
+
+        Returns:
+            bool: 用户名是否已存在。
+        """
+        conditions = [User.username == username]
+        if exclude_id is not None:
+            conditions.append(User.id != exclude_id)
+        return db.scalar(select(exists().where(*conditions)))
 
     def get_by_username(self, db: Session, username: str) -> User | None:
         """根据用户名获取用户
@@ -48,7 +108,7 @@ class CRUDUser:
         Returns:
             User | None: 用户对象或None。
         """
-        return db.query(User).filter(User.username == username).first()
+        return db.execute(select(User).where(User.username == username)).scalar_one_or_none()
 
     def get_by_github_id(self, db: Session, github_id: str) -> User | None:
         """根据GitHub ID获取用户
@@ -60,7 +120,7 @@ class CRUDUser:
         Returns:
             User | None: 用户对象或None。
         """
-        return db.query(User).filter(User.github_id == github_id).first()
+        return db.execute(select(User).where(User.github_id == github_id)).scalar_one_or_none()
     
     def get_by_github_id_or_username(self, db: Session, *, github_id: str, username: str) -> User | None:
         """根据 GitHub ID 或用户名获取用户
@@ -75,15 +135,10 @@ class CRUDUser:
         Returns:
             User | None: 用户对象或 None。
         """
+        # 拆成两次唯一索引查询，避免 OR 条件在 MySQL 上退化为索引合并或全表扫描
         return (
-            db.query(User)
-            .filter(
-                or_(
-                    User.github_id == github_id,          # 主匹配
-                    User.username == username             # 后备匹配
-                )
-            )
-            .first()
+            self.get_by_github_id(db, github_id)          # 主匹配
+            or self.get_by_username(db, username)         # 后备匹配
         )
 
     def get_by_uuid(self, db: Session, uuid: str) -> User | None:
@@ -96,7 +151,21 @@ class CRUDUser:
         Returns:
             User | None: 用户对象或None。
         """
-        return db.query(User).filter(User.uuid == uuid).first()
+        return db.execute(select(User).where(User.uuid == uuid)).scalar_one_or_none()
+
+    def get_public_by_uuid(self, db: Session, uuid: str) -> Row | None:
+        """根据UUID获取用户公开信息，仅读取 uuid、username 与 nickname 三列
+
+        Args:
+            db (Session): 数据库会话。
+            uuid (str): 用户UUID。
+
+        Returns:
+            Row | None: 包含 uuid、username、nickname 的行或None。
+        """
+        return db.execute(
+            select(User.uuid, User.username, User.nickname).where(User.uuid == uuid)
+        ).first()
 
     def create(self, db: Session, obj_in: UserCreate) -> User:
         """创建新用户
@@ -114,6 +183,7 @@ class CRUDUser:
             username=obj_in.username,
             nickname=obj_in.nickname,
             hashed_password=hashed_password,
+            password_peppered=pepper_enabled(),
             github_id=obj_in.github_id,
             github_username=obj_in.github_username,
         )
@@ -138,31 +208,70 @@ class CRUDUser:
         else:
             update_data = obj_in.model_dump(exclude_unset=True)
 
+        update_data = self._prepare_update(db, user_uuid=db_obj.uuid, update_data=update_data)
+
+        for field in update_data:
+            if hasattr(db_obj, field):
+                setattr(db_obj, field, update_data[field])
+
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def update_by_id(self, db: Session, *, id: int, uuid: str, obj_in: UserUpdate) -> User | None:
+        """按ID直接更新用户，只写入请求中实际提供的字段
+
+        不预先加载用户对象，改动的列通过单条 UPDATE 语句写入，之后再读取一次最新数据。
+
+        Args:
+            db (Session): 数据库会话。
+            id (int): 用户ID。
+            uuid (str): 用户UUID，用于更新头像记录。
+            obj_in (UserUpdate): 用户更新模式。
+
+        Returns:
+            User | None: 更新后的用户对象，用户不存在时返回None。
+        """
+        update_data = obj_in.model_dump(exclude_unset=True)
+        update_data = self._prepare_update(db, user_uuid=uuid, update_data=update_data)
+        values = {field: value for field, value in update_data.items() if field in User.__table__.c}
+        if values:
+            db.execute(update(User).where(User.id == id).values(**values))
+        db.commit()
+        return self.get(db, id=id)
+
+    def _prepare_update(self, db: Session, *, user_uuid: str, update_data: Dict[str, Any]) -> Dict[str, Any]:
+        """处理更新数据中的密码与头像
+
+        明文密码替换为哈希密码；头像写入 author_avatars 表（查找或创建），并从更新数据中移除。
+
+        Args:
+            db (Session): 数据库会话。
+            user_uuid (str): 用户UUID。
+            update_data (Dict[str, Any]): 待更新的字段。
+
+        Returns:
+            Dict[str, Any]: 可直接写入用户表的字段。
+        """
         if "password" in update_data and update_data["password"]:
             update_data["hashed_password"] = get_password_hash(update_data["password"])
+            update_data["password_peppered"] = pepper_enabled()
             del update_data["password"]
 
         if "avatar" in update_data:
             avatar_base64 = update_data.pop("avatar")
             if avatar_base64:
                 # 查找或创建头像记录
-                avatar_obj = db.query(AuthorAvatar).filter(AuthorAvatar.user_uuid == db_obj.uuid).first()
+                avatar_obj = db.execute(
+                    select(AuthorAvatar).where(AuthorAvatar.user_uuid == user_uuid)
+                ).scalar_one_or_none()
                 if not avatar_obj:
-                    avatar_obj = AuthorAvatar(user_uuid=db_obj.uuid, base64=avatar_base64)
+                    avatar_obj = AuthorAvatar(user_uuid=user_uuid, base64=avatar_base64)
                     db.add(avatar_obj)
                 else:
                     avatar_obj.base64 = avatar_base64
-
-
-
-        for field in update_data:
-            if hasattr(db_obj, field):
-                setattr(db_obj, field, update_data[field])
-
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
+        return update_data
 
 
 user = CRUDUser()
\ No newline at end of file
@@ -3,11 +3,12 @@
 主要功能：数据库基础类，为所有模型提供基础
 """
 
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import DeclarativeBase
 
 # Import all the models here so that Base.metadata
 # has them registered for Alembic autogenerate
 
 
-# 创建基础类
-Base = declarative_base()
\ No newline at end of file
+class Base(DeclarativeBase):
+    """所有模型的声明式基类（SQLAlchemy 2.0 风格）"""
+    pass
\ No newline at end of file
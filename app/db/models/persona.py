@@ -3,13 +3,18 @@
 主要功能：Persona数据模型定义
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, JSON, func, ForeignKey
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional
+from sqlalchemy import Integer, String, Text, DateTime, Boolean, JSON, func, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func as sql_func
 from sqlalchemy.dialects.mysql import CHAR, MEDIUMTEXT
 import uuid as uuid_lib
 from app.db.base import Base
 
+if TYPE_CHECKING:
+    from app.db.models.user import User
+
 
 class Persona(Base):
     """
@@ -24,7 +29,7 @@ class Persona(Base):
         avatar: 头像URL
         content: 人设内容
         description: 人设描述
-        tags: 标签列表（逗号分隔）
+        tags: 标签列表（逗号分隔，用于展示；筛选与统计走 persona_tags 关联表）
         ext_data: 扩展数据（JSON格式）
         author: 作者
         create_time: 创建时间
@@ -32,28 +37,50 @@ class Persona(Base):
     """
     
     __tablename__ = "personas"
+    __table_args__ = (
+        # 关键词搜索使用的全文索引（ngram 分词以支持中文），仅在 MySQL 上创建
+        Index(
+            "ix_personas_fulltext",
+            "name",
+            "title",
+            "description",
+            "content",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram"
+        ).ddl_if(dialect="mysql"),
+    )
     
-    id = Column(Integer, primary_key=True, autoincrement=True, comment="主键ID")
-    uuid = Column(CHAR(36), unique=True, nullable=False, default=lambda: str(uuid_lib.uuid4()), comment="人设UUID")
-    view_count = Column(Integer, default=0, comment="浏览量")
-    name = Column(String(255), nullable=False, comment="人设名称")
-    title = Column(String(255), nullable=True, comment="人设标题")
-    avatar = Column(Text, nullable=True, comment="头像URL")
-    content = Column(Text, nullable=True, comment="人设内容")
-    description = Column(Text, nullable=True, comment="人设描述")
-    tags = Column(String(255), nullable=True, comment="标签列表，逗号分隔")
-    ext_data = Column(JSON, nullable=True, comment="扩展数据（JSON格式）")
-    author_uuid = Column(CHAR(36), ForeignKey('users.uuid'), nullable=False, comment="作者UUID")
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, comment="主键ID")
+    uuid: Mapped[str] = mapped_column(CHAR(36), unique=True, nullable=False, default=lambda: str(uuid_lib.uuid4()), comment="人设UUID")
+    view_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, comment="浏览量")
+    name: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False, comment="人设名称")
+    title: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, comment="人设标题")
+    avatar: Mapped[Optional[str]] = mapped_column(Text, nullable=True, comment="头像URL")
+    content: Mapped[Optional[str]] = mapped_column(Text, nullable=True, comment="人设内容")
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True, comment="人设描述")
+    tags: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, comment="标签列表，逗号分隔")
+    ext_data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True, comment="扩展数据（JSON格式）")
+    author_uuid: Mapped[str] = mapped_column(CHAR(36), ForeignKey('users.uuid'), index=True, nullable=False, comment="作者UUID")
     
     # 关系定义
-    author = relationship("User", back_populates="personas")
-    avatar_rel = relationship("PersonaAvatar", back_populates="persona", uselist=False, cascade="all, delete-orphan")
-    create_time = Column(
+    # 默认预加载作者与头像：作者按批次用 IN 查询加载，头像为一对一直接 JOIN，避免序列化时逐行懒加载（N+1）
+    author: Mapped["User"] = relationship("User", back_populates="personas", lazy="selectin")
+    avatar_rel: Mapped[Optional["PersonaAvatar"]] = relationship(
+        "PersonaAvatar",
+        back_populates="persona",
+        uselist=False,
+        cascade="all, delete-orphan",
+        lazy="joined"
+    )
+    # 标签关联，仅用于按标签筛选（EXISTS 子查询），由 CRUD 层维护 persona_tags 表
+    tag_rel: Mapped[List["Tag"]] = relationship("Tag", secondary="persona_tags", viewonly=True)
+    create_time: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        nullable=True,
         server_default=sql_func.now(),
         comment="创建时间"
     )
-    update_time = Column(
+    update_time: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True),
         server_default=sql_func.now(),
         onupdate=sql_func.now(),
@@ -77,15 +104,16 @@ class Persona(Base):
             "view_count": self.view_count,
             "name": self.name,
             "title": self.title,
-            "avatar": self.avatar_rel.base64 if self.avatar_rel else self.avatar,
+            "avatar": self.avatar if self.avatar_rel is None else self.avatar_rel.base64,
             "content": self.content,
             "description": self.description,
             "tags": self.tags,
             "ext_data": self.ext_data,
             "author_uuid": self.author_uuid,
             "author_nickname": self.author.nickname if self.author else None,
-            "create_time": self.create_time.isoformat() if self.create_time else None,
-            "update_time": self.update_time.isoformat() if self.update_time else None
+            # 时间保持 datetime 对象，由 orjson 直接序列化
+            "create_time": self.create_time,
+            "update_time": self.update_time
         }
 
 class PersonaAvatar(Base):
@@ -95,16 +123,64 @@ class PersonaAvatar(Base):
     Attributes:
         id: 主键ID
         persona_uuid: 人设UUID (外键)
-        base64: Base64编码的头像字符串
+        base64: Base64编码的头像字符串（延迟加载）
     """
     __tablename__ = "persona_avatars"
 
-    id = Column(Integer, primary_key=True, autoincrement=True, comment="主键ID")
-    persona_uuid = Column(CHAR(36), ForeignKey("personas.uuid"), unique=True, nullable=False, comment="人设UUID")
-    base64 = Column(MEDIUMTEXT, nullable=False, comment="Base64编码的头像")
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, comment="主键ID")
+    persona_uuid: Mapped[str] = mapped_column(CHAR(36), ForeignKey("personas.uuid"), unique=True, nullable=False, comment="人设UUID")
+    # 头像数据可能很大，默认延迟加载，需要时在查询中显式 undefer
+    base64: Mapped[str] = mapped_column(MEDIUMTEXT, nullable=False, deferred=True, comment="Base64编码的头像")
 
-    persona = relationship("Persona", back_populates="avatar_rel")
+    persona: Mapped["Persona"] = relationship("Persona", back_populates="avatar_rel")
 
     def __repr__(self) -> str:
         return f"<PersonaAvatar(id={self.id}, persona_uuid='{self.persona_uuid}')>"
 
+
+class Tag(Base):
+    """
+    Tag数据模型, 存储去重后的标签名称
+
+    Attributes:
+        id: 主键ID
+        name: 标签名称，唯一
+    """
+    __tablename__ = "tags"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, comment="主键ID")
+    name: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False, comment="标签名称")
+
+    def __repr__(self) -> str:
+        return f"<Tag(id={self.id}, name='{self.name}')>"
+
+
+class PersonaTag(Base):
+    """
+    PersonaTag数据模型, 人设与标签的多对多关联
+
+    Attributes:
+        persona_uuid: 人设UUID (外键)
+        tag_id: 标签ID (外键)
+    """
+    __tablename__ = "persona_tags"
+    __table_args__ = (
+        # 主键以 persona_uuid 开头，按标签反查人设需要单独的索引
+        Index("ix_persona_tags_tag_id", "tag_id"),
+    )
+
+    persona_uuid: Mapped[str] = mapped_column(
+        CHAR(36),
+        ForeignKey("personas.uuid", ondelete="CASCADE"),
+        primary_key=True,
+        comment="人设UUID"
+    )
+    tag_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("tags.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="标签ID"
+    )
+
+    def __repr__(self) -> str:
+        return f"<PersonaTag(persona_uuid='{self.persona_uuid}', tag_id={self.tag_id})>"
@@ -3,13 +3,18 @@
 主要功能：定义用户数据库模型
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional
+from sqlalchemy import Boolean, Integer, String, DateTime, Text, ForeignKey, false
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.mysql import CHAR, MEDIUMTEXT
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
 import uuid
 
+if TYPE_CHECKING:
+    from app.db.models.persona import Persona
+
 
 class User(Base):
     """用户数据库模型
@@ -20,6 +25,7 @@ class User(Base):
         email (str): 用户邮箱，唯一。
         username (str): 用户名，唯一。
         hashed_password (str): 哈希密码，用于邮箱登录。
+        password_peppered (bool): 哈希密码生成时是否加入了 pepper，为 False 的旧哈希在登录成功后升级。
         github_id (str): GitHub 用户ID，唯一。
         github_username (str): GitHub 用户名。
         created_at (datetime): 创建时间。
@@ -27,20 +33,21 @@ class User(Base):
     """
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
-    uuid = Column(CHAR(36), unique=True, index=True, nullable=False, default=lambda: str(uuid.uuid4()))
-    email = Column(String(255), unique=True, index=True, nullable=False)
-    username = Column(String(255), unique=True, index=True, nullable=False)
-    nickname = Column(String(255), nullable=True)
-    hashed_password = Column(String(255), nullable=True)
-    github_id = Column(String(255), unique=True, index=True, nullable=True)
-    github_username = Column(String(255), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    uuid: Mapped[str] = mapped_column(CHAR(36), unique=True, index=True, nullable=False, default=lambda: str(uuid.uuid4()))
+    email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
+    username: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
+    nickname: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    hashed_password: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    password_peppered: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default=false())
+    github_id: Mapped[Optional[str]] = mapped_column(String(255), unique=True, index=True, nullable=True)
+    github_username: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True, server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
 
     # 关系定义
-    personas = relationship("Persona", back_populates="author")
-    avatar_rel = relationship("AuthorAvatar", back_populates="user", uselist=False, cascade="all, delete-orphan")
+    personas: Mapped[List["Persona"]] = relationship("Persona", back_populates="author")
+    avatar_rel: Mapped[Optional["AuthorAvatar"]] = relationship("AuthorAvatar", back_populates="user", uselist=False, cascade="all, delete-orphan")
 
 
 class AuthorAvatar(Base):
@@ -54,11 +61,11 @@ class AuthorAvatar(Base):
     """
     __tablename__ = "author_avatars"
 
-    id = Column(Integer, primary_key=True, autoincrement=True, comment="主键ID")
-    user_uuid = Column(CHAR(36), ForeignKey("users.uuid"), unique=True, nullable=False, comment="用户UUID")
-    base64 = Column(MEDIUMTEXT, nullable=False, comment="Base64编码的头像")
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, comment="主键ID")
+    user_uuid: Mapped[str] = mapped_column(CHAR(36), ForeignKey("users.uuid"), unique=True, nullable=False, comment="用户UUID")
+    base64: Mapped[str] = mapped_column(MEDIUMTEXT, nullable=False, comment="Base64编码的头像")
 
-    user = relationship("User", back_populates="avatar_rel")
+    user: Mapped["User"] = relationship("User", back_populates="avatar_rel")
 
     def __repr__(self) -> str:
         return f"<AuthorAvatar(id={self.id}, user_uuid='{self.user_uuid}')>"
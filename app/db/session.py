@@ -7,12 +7,21 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-# 创建数据库引擎
+# 连接池大小、溢出与等待超时仅适用于 QueuePool；SQLite（如 :memory: 使用的 SingletonThreadPool）不接受这些参数
+_pool_kwargs = {} if settings.DATABASE_URL.startswith("sqlite") else {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+}
+
+# 创建数据库引擎，连接池与 SQL 编译缓存参数可通过环境变量调整
 engine = create_engine(
     settings.DATABASE_URL,
+    **_pool_kwargs,
     pool_pre_ping=True,
-    pool_recycle=3600,
-    echo=settings.DEBUG
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    echo=settings.DB_ECHO
 )
 
 # 创建会话工厂
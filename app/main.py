@@ -3,20 +3,74 @@
 主要功能：FastAPI应用入口文件，负责应用的初始化和配置
 """
 
+import asyncio
+import logging
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
+from fastapi.responses import ORJSONResponse
+from slowapi import _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
+from contextlib import asynccontextmanager, suppress
 import os
 from dotenv import load_dotenv
 
-from app.db.session import engine
+from app.db.session import engine, SessionLocal
 from app.db.base import Base
 from app.api.endpoints import personas, tags, authors, auth
 from app.core.config import settings
+from app.core.limiter import limiter
+from app.core.security import pepper_enabled
+from app.crud.persona import persona as crud_persona
+from app.crud.user import user as crud_user
 
 # 加载环境变量
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+
+def check_password_pepper() -> None:
+    """
+    检查 PASSWORD_PEPPER 配置与已有密码哈希是否一致
+    
+    Raises:
+        RuntimeError: 存在包含 pepper 的密码哈希，但未配置 PASSWORD_PEPPER（这些用户将无法登录）
+    """
+    if pepper_enabled():
+        return
+    db = SessionLocal()
+    try:
+        peppered = crud_user.exists_peppered(db)
+    finally:
+        db.close()
+    if peppered:
+        raise RuntimeError("存在包含 pepper 的密码哈希，但未配置 PASSWORD_PEPPER，相关用户将无法登录")
+
+
+def flush_view_counts() -> None:
+    """将内存中暂存的人设浏览量增量写回数据库"""
+    db = SessionLocal()
+    try:
+        crud_persona.flush_views(db)
+    finally:
+        db.close()
+
+
+async def flush_view_counts_periodically(interval: int) -> None:
+    """
+    定期写回人设浏览量
+    
+    Args:
+        interval: 写回间隔（秒）
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_in_threadpool(flush_view_counts)
+        except Exception:
+            logger.exception("浏览量写回数据库失败")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -29,10 +83,22 @@ async def lifespan(app: FastAPI):
     Yields:
         None
     """
-    # 启动时创建数据库表
-    Base.metadata.create_all(bind=engine)
+    # 表结构由 Alembic 迁移管理，仅在开发环境显式开启时才在启动时建表
+    if settings.AUTO_CREATE_TABLES:
+        Base.metadata.create_all(bind=engine)
+    # 缺少 pepper 配置时直接拒绝启动，而不是让已有用户全部登录失败
+    await run_in_threadpool(check_password_pepper)
+    flush_task = asyncio.create_task(
+        flush_view_counts_periodically(settings.VIEW_COUNT_FLUSH_INTERVAL)
+    )
     yield
-    # 关闭时的清理操作
+    # 关闭时的清理操作，停止定期任务后把剩余的浏览量增量写回
+    # 等待任务真正退出，避免与最后一次写回并发执行同一批增量
+    flush_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await flush_task
+    await run_in_threadpool(flush_view_counts)
+    await auth.github_client.aclose()
 
 
 # 创建FastAPI应用实例
@@ -40,16 +106,23 @@ app = FastAPI(
     title="DreamShell API",
     description="人设市场管理系统后端API",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # 使用 orjson 序列化响应，列表类大响应的编码速度明显快于标准库 json
+    default_response_class=ORJSONResponse
 )
 
+# 注册限流器
+app.state.limiter = limiter
+app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
 # 配置CORS
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
+    allow_origin_regex=settings.CORS_ORIGIN_REGEX or None,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=settings.CORS_ALLOW_METHODS,
+    allow_headers=settings.CORS_ALLOW_HEADERS,
 )
 
 # 注册路由
@@ -9,8 +9,10 @@ from app.schemas.persona import (
     PersonaUpdate,
     PersonaInDB,
     PersonaResponse,
+    PersonaSummary,
     PersonaSearch,
-    PersonaListResponse
+    PersonaListResponse,
+    PersonaSummaryListResponse
 )
 
 __all__ = [
@@ -19,6 +21,8 @@ __all__ = [
     "PersonaUpdate",
     "PersonaInDB",
     "PersonaResponse",
+    "PersonaSummary",
     "PersonaSearch",
-    "PersonaListResponse"
+    "PersonaListResponse",
+    "PersonaSummaryListResponse"
 ]
\ No newline at end of file
@@ -5,7 +5,7 @@
 
 from typing import Optional
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from pydantic import AliasChoices, AliasPath, BaseModel, ConfigDict, Field, validator
 
 
 class PersonaBase(BaseModel):
@@ -110,45 +110,38 @@ class PersonaInDB(PersonaBase):
     """
     数据库中的Persona模式
     
+    支持通过 model_validate 直接从ORM对象构建：头像优先取关联的Base64头像，
+    作者信息取自关联的User。
+    
     Attributes:
         id: 主键ID
+        avatar: 头像（Base64或URL）
         author_nickname: 作者昵称（从关联的User获取）
         author_username: 作者用户名（从关联的User获取）
         create_time: 创建时间
         update_time: 更新时间
     """
     
+    model_config = ConfigDict(from_attributes=True)
+    
     id: int = Field(..., description="主键ID")
-    author_nickname: Optional[str] = Field(None, description="作者昵称")
-    author_username: Optional[str] = Field(None, description="作者用户名")
+    avatar: Optional[str] = Field(
+        None,
+        validation_alias=AliasChoices(AliasPath("avatar_rel", "base64"), "avatar"),
+        description="头像 (Base64或URL)"
+    )
+    author_nickname: Optional[str] = Field(
+        None,
+        validation_alias=AliasChoices("author_nickname", AliasPath("author", "nickname")),
+        description="作者昵称"
+    )
+    author_username: Optional[str] = Field(
+        None,
+        validation_alias=AliasChoices("author_username", AliasPath("author", "username")),
+        description="作者用户名"
+    )
     create_time: datetime = Field(..., description="创建时间")
     update_time: Optional[datetime] = Field(None, description="更新时间")
-    
-    class Config:
-        """Pydantic配置"""
-        from_attributes = True
-        
-    @classmethod
-    def from_db(cls, persona_obj):
-        """从数据库对象创建实例"""
-        data = {
-            'id': persona_obj.id,
-            'uuid': persona_obj.uuid,
-            'view_count': persona_obj.view_count,
-            'name': persona_obj.name,
-            'title': persona_obj.title,
-            'avatar': persona_obj.avatar_rel.base64 if persona_obj.avatar_rel else persona_obj.avatar,
-            'content': persona_obj.content,
-            'description': persona_obj.description,
-            'tags': persona_obj.tags,
-            'ext_data': persona_obj.ext_data,
-            'author_uuid': persona_obj.author_uuid,
-            'author_nickname': persona_obj.author.nickname if persona_obj.author else None,
-            'author_username': persona_obj.author.username if persona_obj.author else None,
-            'create_time': persona_obj.create_time,
-            'update_time': persona_obj.update_time
-        }
-        return cls(**data)
 
 
 class PersonaResponse(PersonaInDB):
@@ -156,12 +149,50 @@ class PersonaResponse(PersonaInDB):
     pass
 
 
+class PersonaSummary(BaseModel):
+    """
+    Persona精简模式，用于列表展示
+    
+    不包含人设内容、扩展数据和Base64头像，查询时也不会从数据库读取这些大字段。
+    
+    Attributes:
+        id: 主键ID
+        avatar: 头像URL（Base64头像不返回）
+        author_nickname: 作者昵称
+        author_username: 作者用户名
+    """
+    
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: int = Field(..., description="主键ID")
+    uuid: Optional[str] = Field(None, description="人设UUID")
+    view_count: int = Field(0, description="浏览量")
+    name: str = Field(..., description="人设名称")
+    title: str = Field(..., description="人设标题")
+    avatar: Optional[str] = Field(None, description="头像URL")
+    description: Optional[str] = Field(None, description="人设描述")
+    tags: Optional[str] = Field(None, description="标签列表，逗号分隔")
+    author_uuid: Optional[str] = Field(None, description="作者UUID")
+    author_nickname: Optional[str] = Field(
+        None,
+        validation_alias=AliasChoices("author_nickname", AliasPath("author", "nickname")),
+        description="作者昵称"
+    )
+    author_username: Optional[str] = Field(
+        None,
+        validation_alias=AliasChoices("author_username", AliasPath("author", "username")),
+        description="作者用户名"
+    )
+    create_time: datetime = Field(..., description="创建时间")
+    update_time: Optional[datetime] = Field(None, description="更新时间")
+
+
 class PersonaSearch(BaseModel):
     """
     搜索Persona时的请求模式
     
     Attributes:
-        keyword: 搜索关键词（名称、描述、内容）
+        keyword: 搜索关键词（名称、标题、描述、内容）
         tags: 标签筛选
         author_uuid: 作者UUID筛选
         skip: 分页偏移量
@@ -186,7 +217,24 @@ class PersonaListResponse(BaseModel):
         limit: 当前限制数
     """
     
-    items: list[PersonaResponse] = Field(..., description="Persona列表")
+    items: list[PersonaResponse] = Field(..., description="Persona列表（可直接传入ORM对象列表）")
+    total: int = Field(..., description="总记录数")
+    skip: int = Field(..., description="当前偏移量")
+    limit: int = Field(..., description="当前限制数")
+
+
+class PersonaSummaryListResponse(BaseModel):
+    """
+    Persona精简列表响应模式
+    
+    Attributes:
+        items: Persona精简信息列表
+        total: 总记录数
+        skip: 当前偏移量
+        limit: 当前限制数
+    """
+    
+    items: list[PersonaSummary] = Field(..., description="Persona精简信息列表")
     total: int = Field(..., description="总记录数")
     skip: int = Field(..., description="当前偏移量")
-    limit: int = Field(..., description="当前限制数")
\ No newline at end of file
+    limit: int = Field(..., description="当前限制数")
@@ -3,20 +3,52 @@
 主要功能：定义用户相关的Pydantic模式
 """
 
-from pydantic import BaseModel, EmailStr
-from typing import Optional
+import re
+from dataclasses import dataclass
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+from typing import Annotated, Any, Literal, Optional
 from datetime import datetime
 
 
+# 邮箱格式校验：模块加载时编译一次，模式带锚点且各段互斥，不会出现灾难性回溯
+_EMAIL_RE = re.compile(r"^[^@\s]{1,64}@[^@\s]{1,255}\.[^@\s]{2,}$")
+
+
+def validate_email_fast(v: str) -> str:
+    """校验邮箱格式
+
+    先做长度与 '@' 数量的快速检查，再进行正则匹配。
+
+    Args:
+        v (str): 邮箱字符串。
+
+    Raises:
+        ValueError: 邮箱格式不正确。
+
+    Returns:
+        str: 校验通过的邮箱。
+    """
+    if len(v) > 254 or v.count("@") != 1 or not _EMAIL_RE.match(v):
+        raise ValueError("value is not a valid email address")
+    return v
+
+
+# 替代 EmailStr 的邮箱类型
+Email = Annotated[str, AfterValidator(validate_email_fast)]
+
+# Base64 头像的最大长度（约 1.5MB 图片），超长的请求在校验阶段直接拒绝
+AVATAR_MAX_LENGTH = 2_000_000
+
+
 class UserBase(BaseModel):
     """用户基础模式
 
     Attributes:
-        email (EmailStr): 用户邮箱。
+        email (Email): 用户邮箱。
         username (str): 用户名。
         nickname (Optional[str]): 用户昵称。
     """
-    email: EmailStr
+    email: Email
     username: str
     nickname: Optional[str] = None
 
@@ -26,37 +58,35 @@ class UserCreate(UserBase):
 
     Attributes:
         password (str): 用户密码。
-        username (str): 用户名。
-        nickname (Optional[str]): 用户昵称。
         github_id (Optional[str]): GitHub 用户ID。
         github_username (Optional[str]): GitHub 用户名。
     """
     password: str
-    username: str
-    nickname: Optional[str] = None
     github_id: Optional[str] = None
     github_username: Optional[str] = None
 
 
-class UserUpdate(UserBase):
+class UserUpdate(BaseModel):
     """用户更新模式
 
+    不继承 UserBase，所有字段均为可选，允许部分更新。
+
     Attributes:
-        email (Optional[EmailStr]): 用户邮箱。
+        email (Optional[Email]): 用户邮箱。
         username (Optional[str]): 用户名。
         nickname (Optional[str]): 用户昵称。
         password (Optional[str]): 用户密码。
         github_id (Optional[str]): GitHub 用户ID。
         github_username (Optional[str]): GitHub 用户名。
-        avatar (Optional[str]): 用户头像 (Base64)。
+        avatar (Optional[str]): 用户头像 (Base64)，长度不超过 AVATAR_MAX_LENGTH。
     """
-    email: Optional[EmailStr] = None
+    email: Optional[Email] = None
     username: Optional[str] = None
     nickname: Optional[str] = None
     password: Optional[str] = None
     github_id: Optional[str] = None
     github_username: Optional[str] = None
-    avatar: Optional[str] = None
+    avatar: Optional[str] = Field(None, max_length=AVATAR_MAX_LENGTH)
 
 
 class UserInDBBase(UserBase):
@@ -65,26 +95,36 @@ class UserInDBBase(UserBase):
     Attributes:
         id (int): 用户ID。
         uuid (str): 用户UUID。
-        username (str): 用户名。
-        nickname (Optional[str]): 用户昵称。
+        email (str): 用户邮箱（数据库中的值写入时已校验，这里不再重复校验格式）。
         github_id (Optional[str]): GitHub 用户ID。
         github_username (Optional[str]): GitHub 用户名。
         created_at (datetime): 创建时间。
         updated_at (Optional[datetime]): 更新时间。
         avatar (Optional[str]): 用户头像 (Base64)。
     """
+    model_config = ConfigDict(from_attributes=True, extra='ignore')
+
     id: int
     uuid: str
-    username: str
-    nickname: Optional[str] = None
+    email: str
     github_id: Optional[str] = None
     github_username: Optional[str] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
     avatar: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+
+class UserPublic(BaseModel):
+    """用户公开信息模式，用于作者信息等只需展示身份的接口
+
+    Attributes:
+        uuid (str): 用户UUID。
+        username (str): 用户名。
+        nickname (Optional[str]): 用户昵称。
+    """
+    uuid: str
+    username: str
+    nickname: Optional[str] = None
 
 
 class User(UserInDBBase):
@@ -93,6 +133,59 @@ class User(UserInDBBase):
     pass
 
 
+@dataclass(slots=True, frozen=True)
+class UserOut:
+    """用户响应数据（只读路径使用）
+
+    数据直接来自数据库记录，无需再经过 Pydantic 校验；字段与 User 一致，
+    OpenAPI 文档中的响应结构仍由 User 描述。实例不可变，可在请求之间安全共享（如当前用户缓存）。
+
+    Attributes:
+        id (int): 用户ID。
+        uuid (str): 用户UUID。
+        email (str): 用户邮箱。
+        username (str): 用户名。
+        nickname (Optional[str]): 用户昵称。
+        github_id (Optional[str]): GitHub 用户ID。
+        github_username (Optional[str]): GitHub 用户名。
+        created_at (Optional[datetime]): 创建时间。
+        updated_at (Optional[datetime]): 更新时间。
+        avatar (Optional[str]): 用户头像 (Base64)。
+    """
+    id: int
+    uuid: str
+    email: str
+    username: str
+    nickname: Optional[str]
+    github_id: Optional[str]
+    github_username: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    avatar: Optional[str] = None
+
+    @classmethod
+    def from_db(cls, db_user: Any) -> "UserOut":
+        """从数据库用户对象构建响应数据
+
+        Args:
+            db_user (Any): 数据库中的用户对象。
+
+        Returns:
+            UserOut: 用户响应数据。
+        """
+        return cls(
+            id=db_user.id,
+            uuid=db_user.uuid,
+            email=db_user.email,
+            username=db_user.username,
+            nickname=db_user.nickname,
+            github_id=db_user.github_id,
+            github_username=db_user.github_username,
+            created_at=db_user.created_at,
+            updated_at=db_user.updated_at,
+        )
+
+
 class UserInDB(UserInDBBase):
     """数据库中的用户模式（包含哈希密码）
 
@@ -107,7 +200,7 @@ class Token(BaseModel):
 
     Attributes:
         access_token (str): 访问令牌。
-        token_type (str): 令牌类型。
+        token_type (Literal["bearer"]): 令牌类型，固定为 bearer。
     """
     access_token: str
-    token_type: str
\ No newline at end of file
+    token_type: Literal["bearer"] = "bearer"
\ No newline at end of file
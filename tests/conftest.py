@@ -0,0 +1,136 @@
+"""
+模块名称：conftest.py
+主要功能：测试公共夹具，提供基于内存 SQLite 的数据库会话与测试数据
+"""
+
+import importlib
+import os
+import unicodedata
+from contextlib import contextmanager
+
+# 在导入应用模块之前指定测试配置，避免连接默认的 MySQL
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("SECRET_KEY", "test-secret-key-0123456789abcdef")
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.mysql import MEDIUMTEXT
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.base import Base
+from app.db.models.persona import Tag
+from app.db.models.user import User
+
+
+@compiles(MEDIUMTEXT, "sqlite")
+def _compile_mediumtext_sqlite(element, compiler, **kw):
+    """SQLite 没有 MEDIUMTEXT，建表时使用 TEXT"""
+    return "TEXT"
+
+
+def _fold(value: str) -> str:
+    """去除重音并忽略大小写，模拟 MySQL 的 _ai_ci 排序规则"""
+    decomposed = unicodedata.normalize("NFKD", value)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def _ai_ci(left: str, right: str) -> int:
+    """忽略重音与大小写的 SQLite 排序规则"""
+    left, right = _fold(left), _fold(right)
+    return (left > right) - (left < right)
+
+
+def _register_collations(dbapi_connection, connection_record) -> None:
+    """为每个 SQLite 连接注册 ai_ci 排序规则"""
+    dbapi_connection.create_collation("ai_ci", _ai_ci)
+
+
+def _make_engine():
+    """创建共享单连接的内存 SQLite 引擎并建表（接口会在线程池中访问数据库，需允许跨线程使用连接）"""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    event.listen(engine, "connect", _register_collations)
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@contextmanager
+def count_statements(engine):
+    """统计代码块内发往数据库的 SQL 语句"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    """每个测试前后清空进程内缓存与浏览量缓冲"""
+    from app.api import deps
+    # app.crud 包导出了同名的 persona 实例，这里取模块本身
+    crud_persona_module = importlib.import_module("app.crud.persona")
+
+    def clear():
+        crud_persona_module._invalidate_aggregates()
+        with crud_persona_module._pending_views_lock:
+            crud_persona_module._pending_views.clear()
+        with deps._user_cache_lock:
+            deps._user_cache.clear()
+        with deps._token_cache_lock:
+            deps._token_cache.clear()
+
+    clear()
+    yield
+    clear()
+
+
+@pytest.fixture
+def engine():
+    """内存 SQLite 引擎"""
+    engine = _make_engine()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    """数据库会话，配置与 SessionLocal 一致"""
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def ai_ci_db():
+    """tags.name 使用忽略大小写与重音的排序规则（模拟 MySQL *_ai_ci）的数据库会话"""
+    name_type = Tag.__table__.c.name.type
+    name_type.collation = "ai_ci"
+    try:
+        engine = _make_engine()
+    finally:
+        name_type.collation = None
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def make_user(db, *, email: str = "author@example.com", username: str = "author", nickname: str = None) -> User:
+    """写入一个测试用户"""
+    user = User(email=email, username=username, nickname=nickname, hashed_password="x")
+    db.add(user)
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def author(db):
+    """测试用作者"""
+    return make_user(db, nickname="Author")
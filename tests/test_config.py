@@ -0,0 +1,24 @@
+"""
+模块名称：test_config.py
+主要功能：应用配置测试
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import Settings, get_settings, settings
+
+
+def test_settings_built_once_and_frozen():
+    """配置实例只构造一次，且启动后不可修改"""
+    assert get_settings() is settings
+    with pytest.raises(ValidationError):
+        settings.DEBUG = not settings.DEBUG
+
+
+def test_settings_env_names_case_sensitive(monkeypatch):
+    """环境变量名区分大小写"""
+    monkeypatch.setenv("log_level", "DEBUG")
+    assert Settings().LOG_LEVEL == "INFO"
+    monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+    assert Settings().LOG_LEVEL == "DEBUG"
@@ -0,0 +1,76 @@
+"""
+模块名称：test_deps.py
+主要功能：认证依赖（令牌解析与当前用户获取）测试
+"""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.api import deps
+from app.core.security import create_access_token
+
+
+def _current_user(db, token: str):
+    return asyncio.run(deps.get_current_user(db=db, token=token))
+
+
+def _credentials_error(db, token: str) -> HTTPException:
+    with pytest.raises(HTTPException) as exc_info:
+        _current_user(db, token)
+    return exc_info.value
+
+
+def test_valid_token_returns_user(db, author):
+    """有效令牌返回对应用户"""
+    user = _current_user(db, create_access_token(author.email))
+    assert user.email == author.email
+    assert user.uuid == author.uuid
+
+
+def test_credentials_errors_are_fresh_instances(db, author):
+    """无效令牌与不存在的用户均返回 401，且每次抛出新的异常实例"""
+    first = _credentials_error(db, "not-a-token")
+    second = _credentials_error(db, create_access_token("missing@example.com"))
+    assert first is not second
+    for error in (first, second):
+        assert error.status_code == 401
+        assert error.detail == "Could not validate credentials"
+        assert error.headers == {"WWW-Authenticate": "Bearer"}
+
+
+def test_token_payload_cached_until_expiry(monkeypatch):
+    """校验通过的令牌载荷被缓存；缓存命中后仍按 exp 判断过期并移出缓存"""
+    token = create_access_token("cached@example.com")
+    calls = []
+    original_decode = deps.jwt.decode
+
+    def decode(*args, **kwargs):
+        calls.append(args[0])
+        return original_decode(*args, **kwargs)
+
+    monkeypatch.setattr(deps.jwt, "decode", decode)
+    first = deps.decode_token(token)
+    assert deps.decode_token(token) == first
+    assert len(calls) == 1
+
+    monkeypatch.setattr(deps.time, "time", lambda: first["exp"] + 1)
+    with pytest.raises(deps.ExpiredSignatureError):
+        deps.decode_token(token)
+    assert deps._token_cache_key(token) not in deps._token_cache
+
+
+def test_current_user_cached_until_evicted(db, author):
+    """当前用户按邮箱缓存，用户信息变更后调用 evict_cached_user 重新读取"""
+    email = author.email
+    token = create_access_token(email)
+    assert _current_user(db, token).nickname == "Author"
+
+    author.nickname = "Renamed"
+    db.commit()
+    db.close()
+    assert _current_user(db, token).nickname == "Author"
+
+    deps.evict_cached_user(email)
+    assert _current_user(db, token).nickname == "Renamed"
@@ -0,0 +1,32 @@
+"""
+模块名称：test_exists_checks.py
+主要功能：用户邮箱/用户名与人设名称的唯一性检查测试
+"""
+
+from app.crud.persona import persona as crud_persona
+from app.crud.user import user as crud_user
+from app.schemas.persona import PersonaCreate
+from tests.conftest import make_user
+
+
+def test_user_exists_checks(db, author):
+    """邮箱与用户名存在性检查，更新时可排除自身"""
+    other = make_user(db, email="other@example.com", username="other")
+    assert crud_user.exists_by_email(db, "author@example.com") is True
+    assert crud_user.exists_by_email(db, "missing@example.com") is False
+    assert crud_user.exists_by_email(db, "author@example.com", exclude_id=author.id) is False
+    assert crud_user.exists_by_email(db, "author@example.com", exclude_id=other.id) is True
+    assert crud_user.exists_by_username(db, "author") is True
+    assert crud_user.exists_by_username(db, "missing") is False
+    assert crud_user.exists_by_username(db, "author", exclude_id=author.id) is False
+
+
+def test_persona_exists_by_name(db, author):
+    """人设名称存在性检查，更新时可排除自身"""
+    persona = crud_persona.create(
+        db,
+        obj_in=PersonaCreate(name="taken", title="t", content="c", author_uuid=author.uuid)
+    )
+    assert crud_persona.exists_by_name(db, name="taken") is True
+    assert crud_persona.exists_by_name(db, name="free") is False
+    assert crud_persona.exists_by_name(db, name="taken", exclude_id=persona.id) is False
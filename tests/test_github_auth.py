@@ -0,0 +1,71 @@
+"""
+模块名称：test_github_auth.py
+主要功能：GitHub OAuth 回调测试，GitHub 接口由 httpx.MockTransport 模拟
+"""
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+from fastapi import HTTPException
+
+from app.api import deps
+from app.api.endpoints import auth
+from app.crud.user import user as crud_user
+
+
+def _github(monkeypatch, *, token: dict, user: dict, emails: list = ()):
+    """将共享的 GitHub 客户端替换为返回固定数据的模拟客户端，返回请求记录"""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path == "/login/oauth/access_token":
+            return httpx.Response(200, json=token)
+        if request.url.path == "/user":
+            return httpx.Response(200, json=user)
+        return httpx.Response(200, json=list(emails))
+
+    monkeypatch.setattr(auth, "github_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    return requests
+
+
+def _callback(db, code: str = "code"):
+    return asyncio.run(auth.github_callback(code=code, db=db))
+
+
+def test_callback_creates_then_reuses_user(db, monkeypatch):
+    """首次回调按主邮箱创建用户，再次回调复用同一用户"""
+    requests = _github(
+        monkeypatch,
+        token={"access_token": "gho_token"},
+        user={"id": 42, "login": "octocat", "email": None},
+        emails=[
+            {"email": "old@example.com", "primary": False, "verified": True},
+            {"email": "octo@example.com", "primary": True, "verified": True},
+        ],
+    )
+    response = _callback(db)
+    payload = deps.decode_token(orjson.loads(response.body)["access_token"])
+    assert payload["sub"] == "octo@example.com"
+    assert requests == ["/login/oauth/access_token", "/user", "/user/emails"]
+
+    user = crud_user.get_by_github_id(db, "42")
+    assert (user.username, user.email) == ("octocat", "octo@example.com")
+
+    _callback(db)
+    assert crud_user.get_by_github_id(db, "42").id == user.id
+
+
+def test_callback_rejects_failed_token_exchange(db, monkeypatch):
+    """GitHub 未返回访问令牌时返回 400，并带上 GitHub 的错误说明"""
+    _github(
+        monkeypatch,
+        token={"error": "bad_verification_code", "error_description": "The code is incorrect"},
+        user={},
+    )
+    with pytest.raises(HTTPException) as exc_info:
+        _callback(db)
+    assert exc_info.value.status_code == 400
+    assert "The code is incorrect" in exc_info.value.detail
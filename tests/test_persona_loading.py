@@ -0,0 +1,113 @@
+"""
+模块名称：test_persona_loading.py
+主要功能：人设读写路径的关系加载测试，防止出现未声明的懒加载（raiseload 报错）与逐行查询（N+1）
+"""
+
+import pytest
+
+from app.crud.persona import persona as crud_persona
+from app.schemas.persona import PersonaCreate, PersonaResponse, PersonaSearch, PersonaSummary, PersonaUpdate
+from tests.conftest import count_statements, make_user
+
+_AVATAR = "data:image/png;base64,iVBORw0KGgo="
+
+
+@pytest.fixture
+def personas(db):
+    """三个作者各自的人设：Base64 头像、URL 头像与无头像"""
+    created = []
+    for index, avatar in enumerate([_AVATAR, "https://example.com/a.png", None]):
+        user = make_user(db, email=f"u{index}@example.com", username=f"u{index}", nickname=f"User {index}")
+        created.append(crud_persona.create(db, obj_in=PersonaCreate(
+            name=f"persona{index}",
+            title=f"title{index}",
+            content="content",
+            tags="shared",
+            avatar=avatar,
+            author_uuid=user.uuid,
+        )))
+    ids = [p.id for p in created]
+    # 清空身份映射，保证后续查询从数据库重新加载
+    db.expunge_all()
+    return ids
+
+
+@pytest.mark.parametrize("load", [
+    lambda db: crud_persona.get_multi(db)[0],
+    lambda db: crud_persona.search(db, search_params=PersonaSearch(keyword="persona", tags="shared"))[0],
+    lambda db: crud_persona.get_by_author_uuid(db, author_uuid=db.info["author_uuid"])[0],
+    lambda db: crud_persona.get_by_tags(db, tags="shared"),
+], ids=["get_multi", "search", "get_by_author_uuid", "get_by_tags"])
+def test_full_lists_batch_relationships(db, engine, personas, load):
+    """完整列表：主查询加作者、头像各一次 IN 查询，语句数不随行数增长"""
+    db.info["author_uuid"] = crud_persona.get(db, personas[0]).author_uuid
+    db.expunge_all()
+    with count_statements(engine) as statements:
+        rows = [PersonaResponse.model_validate(p) for p in load(db)]
+    assert rows
+    assert len(statements) <= 3
+    by_name = {row.name: row for row in rows}
+    if "persona0" in by_name:
+        assert by_name["persona0"].avatar == _AVATAR
+        assert by_name["persona0"].author_nickname == "User 0"
+
+
+@pytest.mark.parametrize("load", [
+    lambda db: crud_persona.get_multi_summary(db)[0],
+    lambda db: crud_persona.search_summary(db, search_params=PersonaSearch(keyword="persona"))[0],
+], ids=["get_multi_summary", "search_summary"])
+def test_summary_lists_skip_large_columns(db, engine, personas, load):
+    """精简列表：只加载作者，不读取 Base64 头像"""
+    with count_statements(engine) as statements:
+        rows = [PersonaSummary.model_validate(p) for p in load(db)]
+    assert len(rows) == 3
+    assert len(statements) <= 2
+    assert not any("persona_avatars" in statement for statement in statements)
+
+
+def test_get_loads_avatar_and_author(db, engine, personas):
+    """单条记录：头像 JOIN 进主查询，作者一次 IN 查询"""
+    with count_statements(engine) as statements:
+        response = PersonaResponse.model_validate(crud_persona.get(db, personas[0]))
+    assert response.avatar == _AVATAR
+    assert response.author_username == "u0"
+    assert len(statements) <= 2
+
+
+def test_create_returns_loaded_avatar(db, engine, author):
+    """创建后返回的对象已带回 Base64 头像与作者，序列化时不再查询数据库"""
+    persona = crud_persona.create(db, obj_in=PersonaCreate(
+        name="new", title="t", content="c", avatar=_AVATAR, author_uuid=author.uuid
+    ))
+    with count_statements(engine) as statements:
+        response = PersonaResponse.model_validate(persona)
+    assert response.avatar == _AVATAR
+    assert response.author_nickname == "Author"
+    assert statements == []
+
+
+def test_update_response_serializes(db, engine, personas):
+    """按接口流程读取、更新并序列化，不触发 raiseload，提交后只重新加载一次"""
+    persona = crud_persona.get(db, personas[0])
+    with count_statements(engine) as statements:
+        updated = crud_persona.update(db, db_obj=persona, obj_in=PersonaUpdate(title="new title", tags="x,y"))
+    reloads = [statement for statement in statements if statement.lstrip().startswith("SELECT personas.")]
+    assert len(reloads) == 1
+    with count_statements(engine) as statements:
+        response = PersonaResponse.model_validate(updated)
+    assert statements == []
+    assert response.title == "new title"
+    assert response.avatar == _AVATAR
+    assert response.author_username == "u0"
+
+
+def test_remove_response_serializes(db, engine, personas):
+    """按接口流程读取、删除并序列化被删除的记录"""
+    crud_persona.get(db, personas[0])
+    with count_statements(engine) as statements:
+        removed = crud_persona.remove(db, id=personas[0])
+        response = PersonaResponse.model_validate(removed)
+    assert response.id == personas[0]
+    assert response.avatar == _AVATAR
+    assert crud_persona.get(db, personas[0]) is None
+    assert len(statements) <= 8
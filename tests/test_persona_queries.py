@@ -0,0 +1,129 @@
+"""
+模块名称：test_persona_queries.py
+主要功能：人设列表、搜索与聚合查询测试
+"""
+
+import pytest
+from sqlalchemy.dialects import mysql
+
+from app.crud.persona import persona as crud_persona
+from app.schemas.persona import PersonaCreate, PersonaSearch, PersonaUpdate
+from tests.conftest import count_statements, make_user
+
+
+@pytest.fixture
+def catalog(db, author):
+    """两位作者的五个人设：作者 Author 三个，作者 Other 两个"""
+    other = make_user(db, email="other@example.com", username="other", nickname="Other")
+    specs = [
+        (author, "alpha", "red,blue"),
+        (author, "beta", "red"),
+        (author, "gamma", "green"),
+        (other, "delta", "red,green"),
+        (other, "epsilon", None),
+    ]
+    ids = {}
+    for owner, name, tags in specs:
+        ids[name] = crud_persona.create(db, obj_in=PersonaCreate(
+            name=name, title=f"{name} title", content=f"{name} content", tags=tags, author_uuid=owner.uuid
+        )).id
+    return {"author": author.uuid, "other": other.uuid, "ids": ids}
+
+
+def test_paginate_returns_page_and_total(db, catalog):
+    """分页主查询同时返回当前页与总数，偏移超出范围时单独计算总数"""
+    personas, total = crud_persona.get_multi(db, skip=1, limit=2)
+    assert total == 5
+    assert len(personas) == 2
+
+    personas, total = crud_persona.get_by_author_uuid(db, author_uuid=catalog["other"], limit=1)
+    assert [p.name for p in personas] == ["delta"]
+    assert total == 2
+
+    assert crud_persona.get_multi(db, skip=10, limit=2) == ([], 5)
+
+
+def test_tag_stats_counted_in_sql(db, catalog):
+    """标签使用次数按次数降序排列，不再被使用的标签不计入"""
+    assert list(crud_persona.get_tag_stats(db).items()) == [("red", 3), ("green", 2), ("blue", 1)]
+
+    alpha = crud_persona.get(db, catalog["ids"]["alpha"])
+    crud_persona.update(db, db_obj=alpha, obj_in=PersonaUpdate(tags="red"))
+    assert list(crud_persona.get_tag_stats(db).items()) == [("red", 3), ("green", 2)]
+
+
+def test_aggregates_cached_until_write(db, engine, catalog):
+    """标签与作者聚合结果在缓存有效期内不再查询数据库，人设写操作后失效"""
+    crud_persona.get_all_tags(db)
+    crud_persona.get_authors(db)
+    crud_persona.get_top_authors(db, limit=1)
+    with count_statements(engine) as statements:
+        assert crud_persona.get_all_tags(db) == ["blue", "green", "red"]
+        assert len(crud_persona.get_authors(db)) == 2
+        assert [a["nickname"] for a in crud_persona.get_top_authors(db, limit=1)] == ["Author"]
+    assert statements == []
+
+    # 不同参数单独缓存
+    assert len(crud_persona.get_top_authors(db, limit=2)) == 2
+
+    crud_persona.remove(db, id=catalog["ids"]["gamma"])
+    with count_statements(engine) as statements:
+        assert crud_persona.get_all_tags(db) == ["blue", "green", "red"]
+    assert len(statements) == 1
+
+
+def test_get_authors_single_query(db, engine, catalog):
+    """作者列表一次查询返回每位作者的 UUID 与昵称，每位作者只出现一次"""
+    with count_statements(engine) as statements:
+        authors = crud_persona.get_authors(db)
+    assert sorted(authors, key=lambda a: a["nickname"]) == [
+        {"uuid": catalog["author"], "nickname": "Author"},
+        {"uuid": catalog["other"], "nickname": "Other"},
+    ]
+    assert len(statements) == 1
+
+
+def test_search_total_from_window_count(db, engine, catalog):
+    """搜索结果与总数在同一条查询中返回，不再单独执行 COUNT"""
+    params = PersonaSearch(tags="red", skip=0, limit=2)
+    with count_statements(engine) as statements:
+        personas, total = crud_persona.search(db, search_params=params)
+    assert total == 3
+    assert len(personas) == 2
+    counts = [s for s in statements if "count(" in s.lower()]
+    assert len(counts) == 1 and "OVER" in counts[0]
+
+    personas, total = crud_persona.search_summary(db, search_params=PersonaSearch(author_uuid=catalog["other"]))
+    assert sorted(p.name for p in personas) == ["delta", "epsilon"]
+    assert total == 2
+
+
+def test_keyword_search_uses_fulltext_on_mysql_only(db, catalog, monkeypatch):
+    """MySQL 下关键词使用全文索引短语匹配，其他数据库与过短的关键词回退为 LIKE"""
+    personas, total = crud_persona.search(db, search_params=PersonaSearch(keyword="gamma con"))
+    assert [p.name for p in personas] == ["gamma"]
+    assert total == 1
+
+    monkeypatch.setattr(db.get_bind().dialect, "name", "mysql")
+    mysql_dialect = mysql.dialect()
+    phrase = str(crud_persona._keyword_filter(db, 'a"lpha').compile(dialect=mysql_dialect))
+    assert phrase.startswith("MATCH (personas.name, personas.title, personas.description, personas.content)")
+    assert "IN BOOLEAN MODE" in phrase
+    short = str(crud_persona._keyword_filter(db, "a").compile(dialect=mysql_dialect))
+    assert "LIKE" in short and "MATCH" not in short
+
+
+def test_all_tags_sorted_and_only_in_use(db, catalog):
+    """标签列表在数据库中去重排序，只包含仍被人设使用的标签"""
+    assert crud_persona.get_all_tags(db) == ["blue", "green", "red"]
+    crud_persona.remove(db, id=catalog["ids"]["alpha"])
+    assert crud_persona.get_all_tags(db) == ["green", "red"]
+
+
+def test_tag_filter_requires_every_tag(db, catalog):
+    """多个标签同时筛选时只返回包含全部标签的人设，过滤条件与标签顺序、空白无关"""
+    assert sorted(p.name for p in crud_persona.get_by_tags(db, tags="red")) == ["alpha", "beta", "delta"]
+    assert [p.name for p in crud_persona.get_by_tags(db, tags=" green , red ")] == ["delta"]
+    assert crud_persona.get_by_tags(db, tags="red,red,blue")[0].name == "alpha"
+    assert crud_persona.get_by_tags(db, tags="blue,green") == []
+    assert crud_persona.search(db, search_params=PersonaSearch(tags="red,green"))[1] == 1
@@ -0,0 +1,79 @@
+"""
+模块名称：test_persona_tags.py
+主要功能：人设标签关联表（tags / persona_tags）的同步测试
+"""
+
+from sqlalchemy import func, select
+
+from app.crud.persona import persona as crud_persona
+from app.db.models.persona import PersonaTag, Tag
+from app.schemas.persona import PersonaCreate, PersonaUpdate
+from tests.conftest import make_user
+
+
+def _create(db, author_uuid: str, name: str, tags: str):
+    """创建带标签的人设"""
+    return crud_persona.create(
+        db,
+        obj_in=PersonaCreate(name=name, title=name, content="content", tags=tags, author_uuid=author_uuid)
+    )
+
+
+def _linked_tags(db, persona) -> list:
+    """人设当前关联的标签名称"""
+    return sorted(db.scalars(
+        select(Tag.name).join(PersonaTag, PersonaTag.tag_id == Tag.id)
+        .where(PersonaTag.persona_uuid == persona.uuid)
+    ))
+
+
+def _tag_count(db) -> int:
+    return db.scalar(select(func.count()).select_from(Tag))
+
+
+def test_create_links_tags(db, author):
+    """创建人设时写入标签与关联"""
+    persona = _create(db, author.uuid, "p1", "a, b")
+    assert _linked_tags(db, persona) == ["a", "b"]
+    assert _tag_count(db) == 2
+
+
+def test_update_replaces_links(db, author):
+    """更新标签时重建关联，旧标签保留在标签表中"""
+    persona = _create(db, author.uuid, "p1", "a,b")
+    persona = crud_persona.update(db, db_obj=persona, obj_in=PersonaUpdate(tags="b,c"))
+    assert _linked_tags(db, persona) == ["b", "c"]
+    assert _tag_count(db) == 3
+
+
+def test_shared_tags_reuse_rows(db, author):
+    """不同人设的同名标签共用一行"""
+    other = make_user(db, email="other@example.com", username="other")
+    first = _create(db, author.uuid, "p1", "shared,x")
+    second = _create(db, other.uuid, "p2", "shared")
+    assert _tag_count(db) == 2
+    assert _linked_tags(db, first) == ["shared", "x"]
+    assert _linked_tags(db, second) == ["shared"]
+    assert [p.name for p in crud_persona.get_by_tags(db, tags="shared")] == ["p1", "p2"]
+
+
+def test_case_variants_link_once(db, author):
+    """同一标签的大小写变体只关联一次"""
+    persona = _create(db, author.uuid, "p1", "Foo,foo,FOO")
+    assert _linked_tags(db, persona) == ["Foo"]
+
+
+def test_accent_variants_follow_db_collation(ai_ci_db):
+    """排序规则忽略重音时，café 与 cafe 视为同一标签，不违反唯一索引与关联表主键"""
+    db = ai_ci_db
+    author = make_user(db)
+    first = _create(db, author.uuid, "p1", "café,cafe")
+    assert _linked_tags(db, first) == ["café"]
+
+    second = _create(db, author.uuid, "p2", "cafe")
+    assert _tag_count(db) == 1
+    assert _linked_tags(db, second) == ["café"]
+
+    second = crud_persona.update(db, db_obj=second, obj_in=PersonaUpdate(tags="CAFE,Café,new"))
+    assert _linked_tags(db, second) == ["café", "new"]
+    assert _tag_count(db) == 2
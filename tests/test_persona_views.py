@@ -0,0 +1,124 @@
+"""
+模块名称：test_persona_views.py
+主要功能：人设浏览量内存缓冲与批量写回测试
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app import main
+from app.api.endpoints import auth, personas
+from app.crud.persona import persona as crud_persona
+from app.db.models.persona import Persona
+from app.schemas.persona import PersonaCreate
+from app.schemas.user import UserOut
+from tests.conftest import count_statements, make_user
+
+
+def _create(db, author, name: str) -> int:
+    """创建人设并返回ID"""
+    return crud_persona.create(
+        db,
+        obj_in=PersonaCreate(name=name, title=name, content="content", author_uuid=author.uuid)
+    ).id
+
+
+def _view_count(db, persona_id: int) -> int:
+    db.expire_all()
+    return db.get(Persona, persona_id).view_count
+
+
+def test_flush_views_writes_increments(db, author):
+    """浏览量先累计在内存中，写回时一次性加到数据库并清空缓冲"""
+    first, second = _create(db, author, "p1"), _create(db, author, "p2")
+    assert crud_persona.queue_view(id=first) == 1
+    assert crud_persona.queue_view(id=first) == 2
+    crud_persona.queue_view(id=second)
+    assert crud_persona.get_pending_views(id=first) == 2
+    assert _view_count(db, first) == 0
+
+    assert crud_persona.flush_views(db) == 2
+    assert _view_count(db, first) == 2
+    assert _view_count(db, second) == 1
+    assert crud_persona.get_pending_views(id=first) == 0
+    assert crud_persona.flush_views(db) == 0
+
+
+def test_flush_views_restores_increments_on_failure(db, author, monkeypatch):
+    """写回失败时增量放回缓冲区，下次写回不会丢失"""
+    persona_id = _create(db, author, "p1")
+    crud_persona.queue_view(id=persona_id)
+    crud_persona.queue_view(id=persona_id)
+
+    def fail(*args, **kwargs):
+        raise OperationalError("UPDATE", {}, Exception("database is locked"))
+
+    with monkeypatch.context() as patch:
+        patch.setattr(db, "execute", fail)
+        with pytest.raises(OperationalError):
+            crud_persona.flush_views(db)
+    assert crud_persona.get_pending_views(id=persona_id) == 2
+
+    crud_persona.flush_views(db)
+    assert _view_count(db, persona_id) == 2
+
+
+def test_view_endpoint_counts_visitors_not_author(db, author):
+    """浏览接口只为非作者访问累计浏览量，响应中包含尚未写回的增量"""
+    persona_id = _create(db, author, "p1")
+    visitor = UserOut.from_db(make_user(db, email="visitor@example.com", username="visitor"))
+    owner = UserOut.from_db(author)
+
+    def view(current_user):
+        return personas.increment_persona_view(db=db, persona_id=persona_id, current_user=current_user)
+
+    assert view(None).view_count == 1
+    assert view(visitor).view_count == 2
+    assert view(owner).view_count == 2
+    assert crud_persona.get_pending_views(id=persona_id) == 2
+
+    crud_persona.flush_views(db)
+    assert view(owner).view_count == 2
+    assert _view_count(db, persona_id) == 2
+
+
+def test_lifespan_stops_flush_task_before_final_flush(monkeypatch):
+    """关闭时先等待定期写回任务退出，再执行最后一次写回"""
+    events = []
+
+    def flush_view_counts():
+        events.append("flush")
+
+    async def flush_periodically(interval):
+        try:
+            await asyncio.sleep(3600)
+        finally:
+            # 模拟被取消时仍在进行中的写回：任务需要一段时间才真正退出
+            await asyncio.sleep(0.2)
+            events.append("stopped")
+
+    monkeypatch.setattr(main, "check_password_pepper", lambda: None)
+    monkeypatch.setattr(main, "flush_view_counts", flush_view_counts)
+    monkeypatch.setattr(main, "flush_view_counts_periodically", flush_periodically)
+    monkeypatch.setattr(auth, "github_client", httpx.AsyncClient())
+
+    async def run():
+        async with main.lifespan(main.app):
+            await asyncio.sleep(0)
+
+    asyncio.run(run())
+    assert events == ["stopped", "flush"]
+
+
+def test_flush_views_single_executemany(db, engine, author):
+    """多个人设的浏览量增量由同一条 UPDATE 以 executemany 一次写回"""
+    ids = [_create(db, author, f"p{index}") for index in range(3)]
+    for persona_id in ids:
+        crud_persona.queue_view(id=persona_id)
+    with count_statements(engine) as statements:
+        assert crud_persona.flush_views(db) == 3
+    assert [s.split()[0] for s in statements] == ["UPDATE"]
+    assert all(_view_count(db, persona_id) == 1 for persona_id in ids)
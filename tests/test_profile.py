@@ -0,0 +1,27 @@
+"""
+模块名称：test_profile.py
+主要功能：用户个人信息更新接口测试
+"""
+
+import orjson
+
+from app.api.endpoints import auth
+from app.crud.persona import persona as crud_persona
+from app.schemas.persona import PersonaCreate
+from app.schemas.user import UserOut, UserUpdate
+
+
+def _update_profile(db, user, **fields) -> dict:
+    """以该用户身份调用个人信息更新接口，返回响应 JSON"""
+    response = auth.update_user_profile(db=db, user_update=UserUpdate(**fields), current_user=UserOut.from_db(user))
+    return orjson.loads(response.body)
+
+
+def test_nickname_change_refreshes_author_listings(db, author):
+    """修改昵称后作者列表不再返回缓存中的旧昵称"""
+    crud_persona.create(db, obj_in=PersonaCreate(name="p1", title="t", content="c", author_uuid=author.uuid))
+    assert [a["nickname"] for a in crud_persona.get_authors(db)] == ["Author"]
+
+    _update_profile(db, author, nickname="Renamed")
+    assert [a["nickname"] for a in crud_persona.get_authors(db)] == ["Renamed"]
+    assert crud_persona.get_top_authors(db)[0]["nickname"] == "Renamed"
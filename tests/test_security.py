@@ -0,0 +1,139 @@
+"""
+模块名称：test_security.py
+主要功能：密码校验相关测试，确保“用户不存在”与“密码错误”两种失败路径的哈希校验次数一致，
+以及 pepper 配置缺失时能被发现
+"""
+
+import asyncio
+import logging
+import threading
+import time
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app import main
+from app.core import security
+from tests.conftest import make_user
+
+
+@pytest.fixture
+def peppered(monkeypatch):
+    """启用 pepper，并统计 pwd_context 的哈希校验次数"""
+    monkeypatch.setattr(
+        security, "settings", security.settings.model_copy(update={"PASSWORD_PEPPER": "test-pepper"})
+    )
+    security._dummy_hash.cache_clear()
+    calls = []
+    context = security.pwd_context
+    original_verify = context.verify
+    original_verify_and_update = context.verify_and_update
+
+    def verify(*args, **kwargs):
+        calls.append("verify")
+        return original_verify(*args, **kwargs)
+
+    def verify_and_update(*args, **kwargs):
+        calls.append("verify_and_update")
+        return original_verify_and_update(*args, **kwargs)
+
+    monkeypatch.setattr(context, "verify", verify)
+    monkeypatch.setattr(context, "verify_and_update", verify_and_update)
+    yield calls
+    security._dummy_hash.cache_clear()
+
+
+def test_unknown_user_and_wrong_password_cost_one_check(peppered):
+    """用户不存在与密码错误时各只做一次哈希校验"""
+    hashed = security.get_password_hash("right-password")
+    security._dummy_hash()
+    peppered.clear()
+
+    security.verify_dummy_password("wrong-password")
+    unknown_user_calls = len(peppered)
+    peppered.clear()
+
+    verified, new_hash = security.verify_and_update_password("wrong-password", hashed, True)
+    wrong_password_calls = len(peppered)
+
+    assert (verified, new_hash) == (False, None)
+    assert unknown_user_calls == wrong_password_calls == 1
+
+
+def test_legacy_hash_verified_once_and_upgraded(peppered):
+    """未加 pepper 的旧哈希只按原始密码校验一次，通过后升级为含 pepper 的哈希"""
+    legacy = security.pwd_context.hash("right-password")
+    peppered.clear()
+
+    assert security.verify_and_update_password("wrong-password", legacy, False) == (False, None)
+    assert len(peppered) == 1
+    peppered.clear()
+
+    verified, new_hash = security.verify_and_update_password("right-password", legacy, False)
+    assert verified and new_hash
+    assert len(peppered) == 1
+    assert security.verify_and_update_password("right-password", new_hash, True)[0]
+
+
+def test_peppered_hash_without_pepper_logs_error(caplog):
+    """哈希包含 pepper 但未配置 PASSWORD_PEPPER 时记录错误日志"""
+    hashed = security.pwd_context.hash("whatever")
+    with caplog.at_level(logging.ERROR, logger=security.__name__):
+        assert security.verify_and_update_password("right-password", hashed, True) == (False, None)
+    assert "PASSWORD_PEPPER" in caplog.text
+
+
+def test_startup_rejects_peppered_users_without_pepper(db, engine, monkeypatch):
+    """已有包含 pepper 的哈希而未配置 PASSWORD_PEPPER 时拒绝启动"""
+    monkeypatch.setattr(main, "SessionLocal", sessionmaker(bind=engine))
+    user = make_user(db)
+    main.check_password_pepper()
+
+    user.password_peppered = True
+    db.commit()
+    with pytest.raises(RuntimeError, match="PASSWORD_PEPPER"):
+        main.check_password_pepper()
+
+    monkeypatch.setattr(
+        security, "settings", security.settings.model_copy(update={"PASSWORD_PEPPER": "test-pepper"})
+    )
+    main.check_password_pepper()
+
+
+def test_bcrypt_hash_upgraded_to_argon2():
+    """旧的 bcrypt 哈希校验通过后换成 Argon2id 哈希，新哈希无需再升级"""
+    legacy = security.pwd_context.hash("right-password", scheme="bcrypt")
+    assert security.verify_and_update_password("wrong-password", legacy, True) == (False, None)
+
+    verified, new_hash = security.verify_and_update_password("right-password", legacy, True)
+    assert verified
+    assert new_hash.startswith("$argon2id$")
+    assert security.verify_and_update_password("right-password", new_hash, True) == (True, None)
+
+
+def test_password_tasks_run_off_loop_within_worker_limit(monkeypatch):
+    """密码哈希任务在事件循环之外的线程中执行，并发数不超过 PASSWORD_HASH_WORKERS"""
+    monkeypatch.setattr(
+        security, "settings", security.settings.model_copy(update={"PASSWORD_HASH_WORKERS": 2})
+    )
+    monkeypatch.setattr(security, "_hash_limiter", None)
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+    threads = set()
+
+    def task(value):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        threads.add(threading.get_ident())
+        time.sleep(0.05)
+        with lock:
+            state["running"] -= 1
+        return value * 2
+
+    async def run():
+        return await asyncio.gather(*(security.run_password_task(task, i) for i in range(6)))
+
+    assert asyncio.run(run()) == [0, 2, 4, 6, 8, 10]
+    assert state["peak"] == 2
+    assert threading.get_ident() not in threads
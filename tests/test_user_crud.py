@@ -0,0 +1,42 @@
+"""
+模块名称：test_user_crud.py
+主要功能：用户 CRUD 操作测试
+"""
+
+from app.core import security
+from app.crud.user import user as crud_user
+from app.schemas.user import UserUpdate
+from tests.conftest import count_statements, make_user
+
+
+def test_github_lookup_prefers_github_id(db):
+    """优先按 GitHub ID 匹配，找不到时再按用户名匹配"""
+    linked = make_user(db, email="linked@example.com", username="linked")
+    linked.github_id = "42"
+    namesake = make_user(db, email="namesake@example.com", username="octocat")
+
+    assert crud_user.get_by_github_id_or_username(db, github_id="42", username="octocat").id == linked.id
+    assert crud_user.get_by_github_id_or_username(db, github_id="7", username="octocat").id == namesake.id
+    assert crud_user.get_by_github_id_or_username(db, github_id="7", username="nobody") is None
+
+
+def test_update_by_id_writes_only_sent_fields(db, engine, author):
+    """按ID更新只写入请求中提供的列，密码写入哈希，头像写入头像表"""
+    with count_statements(engine) as statements:
+        user = crud_user.update_by_id(
+            db, id=author.id, uuid=author.uuid,
+            obj_in=UserUpdate(nickname="Renamed", password="new-password", avatar="data:image/png;base64,AA==")
+        )
+    updates = [s for s in statements if s.startswith("UPDATE users")]
+    assert len(updates) == 1
+    assert "email" not in updates[0] and "username" not in updates[0]
+
+    assert (user.nickname, user.username, user.email) == ("Renamed", "author", "author@example.com")
+    assert security.verify_password("new-password", user.hashed_password, user.password_peppered)
+    assert user.password_peppered is security.pepper_enabled()
+    assert crud_user.get_avatar(db, author.uuid) == "data:image/png;base64,AA=="
+
+
+def test_update_by_id_missing_user(db):
+    """用户不存在时返回None"""
+    assert crud_user.update_by_id(db, id=999, uuid="missing", obj_in=UserUpdate(nickname="x")) is None